@@ -16,14 +16,30 @@ Options:
 """
 
 import argparse
+import io
 import json
+import mmap
 import os
 import re
+import string
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class PackageManager(Enum):
@@ -34,7 +50,7 @@ class PackageManager(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Dependency:
     name: str
     version: str
@@ -42,7 +58,7 @@ class Dependency:
     is_dev: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalysisResult:
     project_path: str
     package_manager: PackageManager
@@ -129,25 +145,43 @@ TESTING_PATTERNS = {
 }
 
 
-def categorize_dependency(name: str) -> str:
-    """Categorize a dependency by type."""
-    name_lower = name.lower()
+# Pre-compiled category matchers, tested in priority order.  Each category's
+# pattern keys are folded into a single alternation so a dependency name is
+# scanned once per category instead of once per pattern; the display names
+# in the tables above are not needed for categorization.  Category labels
+# are interned so the per-type counters hash and compare them by identity.
+_CATEGORY_MATCHERS = tuple(
+    (re.compile("|".join(re.escape(p.lower()) for p in patterns)), sys.intern(category))
+    for patterns, category in (
+        (FRAMEWORK_PATTERNS, "framework"),
+        (DATABASE_PATTERNS, "database"),
+        (SERVICE_PATTERNS, "service"),
+        (TESTING_PATTERNS, "testing"),
+    )
+)
 
-    for pattern, category in FRAMEWORK_PATTERNS.items():
-        if pattern in name_lower:
-            return "framework"
 
-    for pattern, category in DATABASE_PATTERNS.items():
-        if pattern in name_lower:
-            return "database"
+# requirements.txt lexing: valid package-name characters and the characters
+# that can open a version specifier (==, >=, <=, !=, ~=, >, <)
+_REQ_NAME_CHARS = string.ascii_letters + string.digits + "_-"
+_REQ_OP_CHARS = "=<>!~"
 
-    for pattern, category in SERVICE_PATTERNS.items():
-        if pattern in name_lower:
-            return "service"
+# Manifest parsing patterns, compiled once at import time
+_GO_VERSION = re.compile(rb'go\s+(\d+\.\d+(?:\.\d+)?)')
+_GO_REQUIRE_BLOCK = re.compile(rb'require\s*\(([\s\S]*?)\)')
+_GO_SINGLE_REQUIRE = re.compile(rb'^\s*require\s+(?!\()(\S+)\s+(\S+)', re.M)
+_POETRY_KV = re.compile(r'^([a-zA-Z0-9_-]+)\s*=\s*"?([^"\n]+)"?')
+_POETRY_VERSION = re.compile(r'version\s*=\s*"([^"]+)"')
 
-    for pattern, category in TESTING_PATTERNS.items():
-        if pattern in name_lower:
-            return "testing"
+
+@lru_cache(maxsize=4096)
+def categorize_dependency(name: str) -> str:
+    """Categorize a dependency by type (cached; depends only on the name)."""
+    name_lower = name.lower()
+
+    for matcher, category in _CATEGORY_MATCHERS:
+        if matcher.search(name_lower):
+            return category
 
     return "utility"
 
@@ -165,8 +199,8 @@ def parse_package_json(project_path: Path) -> AnalysisResult:
         return result
 
     try:
-        with open(package_json_path, "r") as f:
-            data = json.load(f)
+        # Decode straight from bytes; json.loads detects the UTF encoding
+        data = json.loads(package_json_path.read_bytes())
 
         # Production dependencies
         for name, version in data.get("dependencies", {}).items():
@@ -196,6 +230,34 @@ def parse_package_json(project_path: Path) -> AnalysisResult:
     return result
 
 
+def _parse_requirement_line(line: str) -> Optional[tuple[str, str]]:
+    """Split a stripped requirement line into (name, version).
+
+    Handles ``package``, ``package==1.0``, ``package>=1.0`` and friends with
+    plain ``str.find`` scans. Returns None for lines that are not a simple
+    package reference (URLs, ``-r`` includes, extras, ...).
+    """
+    split_at = -1
+    for op in _REQ_OP_CHARS:
+        idx = line.find(op)
+        if idx != -1 and (split_at == -1 or idx < split_at):
+            split_at = idx
+
+    if split_at == -1:
+        name, version = line, "latest"
+    else:
+        name = line[:split_at].rstrip()
+        version = line[split_at:].lstrip(_REQ_OP_CHARS).strip()
+        if not version:
+            return None
+
+    # Reject names containing anything but letters, digits, '_' and '-'
+    if not name or name.strip(_REQ_NAME_CHARS):
+        return None
+
+    return name, version
+
+
 def parse_requirements_txt(project_path: Path) -> AnalysisResult:
     """Parse requirements.txt for Python projects."""
     result = AnalysisResult(
@@ -221,19 +283,10 @@ def parse_requirements_txt(project_path: Path) -> AnalysisResult:
                 if ";" in line:
                     line = line.split(";")[0].strip()
 
-                # Parse package==version or package>=version formats
-                match = re.match(r'^([a-zA-Z0-9_-]+)\s*([=<>!]+)\s*(.+)$', line)
-                if match:
-                    name = match.group(1)
-                    version = match.group(3)
-                else:
-                    # Just package name
-                    match = re.match(r'^([a-zA-Z0-9_-]+)$', line)
-                    if match:
-                        name = match.group(1)
-                        version = "latest"
-                    else:
-                        continue
+                parsed = _parse_requirement_line(line)
+                if parsed is None:
+                    continue
+                name, version = parsed
 
                 result.dependencies.append(Dependency(
                     name=name,
@@ -248,6 +301,43 @@ def parse_requirements_txt(project_path: Path) -> AnalysisResult:
     return result
 
 
+def _scan_go_mod(content: bytes, result: AnalysisResult) -> None:
+    """Collect the Go version and required modules from go.mod bytes."""
+    # Extract Go version
+    go_version_match = _GO_VERSION.search(content)
+    if go_version_match:
+        result.dependencies.append(Dependency(
+            name="go",
+            version=go_version_match.group(1).decode(),
+            dep_type="language",
+            is_dev=False
+        ))
+
+    # Extract every require (...) block
+    for require_match in _GO_REQUIRE_BLOCK.finditer(content):
+        for line in require_match.group(1).split(b'\n'):
+            parts = line.split()
+            if len(parts) >= 2 and not parts[0].startswith(b'//'):
+                name = parts[0].decode()
+                result.dependencies.append(Dependency(
+                    name=name,
+                    version=parts[1].decode(),
+                    dep_type=categorize_dependency(name),
+                    is_dev=False
+                ))
+
+    # Single-line requires; the pattern skips the block form so block
+    # entries are not counted twice
+    for name, version in _GO_SINGLE_REQUIRE.findall(content):
+        name = name.decode()
+        result.dependencies.append(Dependency(
+            name=name,
+            version=version.decode(),
+            dep_type=categorize_dependency(name),
+            is_dev=False
+        ))
+
+
 def parse_go_mod(project_path: Path) -> AnalysisResult:
     """Parse go.mod for Go projects."""
     result = AnalysisResult(
@@ -261,46 +351,101 @@ def parse_go_mod(project_path: Path) -> AnalysisResult:
         return result
 
     try:
-        with open(go_mod_path, "r") as f:
-            content = f.read()
+        # Scan the file through a read-only memory map rather than copying it
+        # into a str; only the matched names/versions are decoded
+        with open(go_mod_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    _scan_go_mod(content, result)
 
-        # Extract Go version
-        go_version_match = re.search(r'go\s+(\d+\.\d+(?:\.\d+)?)', content)
-        if go_version_match:
-            result.dependencies.append(Dependency(
-                name="go",
-                version=go_version_match.group(1),
-                dep_type="language",
-                is_dev=False
-            ))
+    except Exception as e:
+        result.errors.append(f"Error reading go.mod: {e}")
+
+    return result
+
+
+def _poetry_version(spec: object) -> str:
+    """Extract a version string from a Poetry dependency specification."""
+    if isinstance(spec, str):
+        return spec
+    if isinstance(spec, dict):
+        return str(spec.get("version", "*"))
+    if isinstance(spec, list):
+        # Multiple-constraint form: [{version = "x", python = "..."}, ...]
+        return ", ".join(_poetry_version(s) for s in spec)
+    return str(spec)
+
+
+def _parse_poetry_tables(content: str, result: AnalysisResult) -> None:
+    """Extract Poetry dependencies using the stdlib TOML parser."""
+    data = tomllib.loads(content)
+    poetry = data.get("tool", {}).get("poetry", {})
+    dev_group = poetry.get("group", {}).get("dev", {})
+
+    for table, is_dev in (
+        (poetry.get("dependencies", {}), False),
+        (dev_group.get("dependencies", {}), True),
+    ):
+        for name, spec in table.items():
+            # Skip python version spec
+            if name == 'python':
+                continue
 
-        # Extract require block
-        require_match = re.search(r'require\s*\(([\s\S]*?)\)', content)
-        if require_match:
-            for line in require_match.group(1).strip().split('\n'):
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    result.dependencies.append(Dependency(
-                        name=parts[0],
-                        version=parts[1],
-                        dep_type=categorize_dependency(parts[0]),
-                        is_dev=False
-                    ))
-
-        # Single-line requires
-        single_requires = re.findall(r'require\s+([^\s]+)\s+([^\s]+)', content)
-        for name, version in single_requires:
             result.dependencies.append(Dependency(
                 name=name,
-                version=version,
+                version=_poetry_version(spec),
                 dep_type=categorize_dependency(name),
-                is_dev=False
+                is_dev=is_dev
             ))
 
-    except Exception as e:
-        result.errors.append(f"Error reading go.mod: {e}")
 
-    return result
+def _parse_poetry_lines(content: str, result: AnalysisResult) -> None:
+    """Extract Poetry dependencies line by line (Python < 3.11 fallback)."""
+    # Simple TOML parsing for dependencies (basic implementation)
+    # Look for [tool.poetry.dependencies] section
+    in_deps = False
+    in_dev_deps = False
+
+    for line in content.split('\n'):
+        line_stripped = line.strip()
+
+        if line_stripped == '[tool.poetry.dependencies]':
+            in_deps = True
+            in_dev_deps = False
+            continue
+        elif line_stripped == '[tool.poetry.group.dev.dependencies]':
+            in_deps = False
+            in_dev_deps = True
+            continue
+        elif line_stripped.startswith('['):
+            in_deps = False
+            in_dev_deps = False
+            continue
+
+        if in_deps or in_dev_deps:
+            # Parse: package = "version" or package = {version = "x"}
+            match = _POETRY_KV.match(line_stripped)
+            if match:
+                name = match.group(1)
+                version_spec = match.group(2)
+
+                # Skip python version spec
+                if name == 'python':
+                    continue
+
+                # Extract version from {version = "x"} format
+                version_match = _POETRY_VERSION.search(version_spec)
+                if version_match:
+                    version = version_match.group(1)
+                else:
+                    version = version_spec.strip('"\'')
+
+                result.dependencies.append(Dependency(
+                    name=name,
+                    version=version,
+                    dep_type=categorize_dependency(name),
+                    is_dev=in_dev_deps
+                ))
 
 
 def parse_pyproject_toml(project_path: Path) -> AnalysisResult:
@@ -319,51 +464,10 @@ def parse_pyproject_toml(project_path: Path) -> AnalysisResult:
         with open(pyproject_path, "r") as f:
             content = f.read()
 
-        # Simple TOML parsing for dependencies (basic implementation)
-        # Look for [tool.poetry.dependencies] section
-        in_deps = False
-        in_dev_deps = False
-
-        for line in content.split('\n'):
-            line_stripped = line.strip()
-
-            if line_stripped == '[tool.poetry.dependencies]':
-                in_deps = True
-                in_dev_deps = False
-                continue
-            elif line_stripped == '[tool.poetry.group.dev.dependencies]':
-                in_deps = False
-                in_dev_deps = True
-                continue
-            elif line_stripped.startswith('['):
-                in_deps = False
-                in_dev_deps = False
-                continue
-
-            if in_deps or in_dev_deps:
-                # Parse: package = "version" or package = {version = "x"}
-                match = re.match(r'^([a-zA-Z0-9_-]+)\s*=\s*"?([^"\n]+)"?', line_stripped)
-                if match:
-                    name = match.group(1)
-                    version_spec = match.group(2)
-
-                    # Skip python version spec
-                    if name == 'python':
-                        continue
-
-                    # Extract version from {version = "x"} format
-                    version_match = re.search(r'version\s*=\s*"([^"]+)"', version_spec)
-                    if version_match:
-                        version = version_match.group(1)
-                    else:
-                        version = version_spec.strip('"\'')
-
-                    result.dependencies.append(Dependency(
-                        name=name,
-                        version=version,
-                        dep_type=categorize_dependency(name),
-                        is_dev=in_dev_deps
-                    ))
+        if tomllib is not None:
+            _parse_poetry_tables(content, result)
+        else:
+            _parse_poetry_lines(content, result)
 
     except Exception as e:
         result.errors.append(f"Error reading pyproject.toml: {e}")
@@ -371,23 +475,47 @@ def parse_pyproject_toml(project_path: Path) -> AnalysisResult:
     return result
 
 
+# Manifest file names, in the order managers are reported
+_MANIFESTS = (
+    ("package.json", PackageManager.NPM),
+    ("requirements.txt", PackageManager.PIP),
+    ("go.mod", PackageManager.GO),
+    ("pyproject.toml", PackageManager.POETRY),
+)
+
+
 def detect_package_manager(project_path: Path) -> list[PackageManager]:
     """Detect which package managers are used in the project."""
-    managers = []
+    # One directory read instead of a stat() per manifest
+    try:
+        with os.scandir(project_path) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        names = set()
 
-    if (project_path / "package.json").exists():
-        managers.append(PackageManager.NPM)
+    managers = [manager for filename, manager in _MANIFESTS if filename in names]
 
-    if (project_path / "requirements.txt").exists():
-        managers.append(PackageManager.PIP)
+    return managers if managers else [PackageManager.UNKNOWN]
 
-    if (project_path / "go.mod").exists():
-        managers.append(PackageManager.GO)
 
-    if (project_path / "pyproject.toml").exists():
-        managers.append(PackageManager.POETRY)
+_PARSERS = {
+    PackageManager.NPM: parse_package_json,
+    PackageManager.PIP: parse_requirements_txt,
+    PackageManager.GO: parse_go_mod,
+    PackageManager.POETRY: parse_pyproject_toml,
+}
 
-    return managers if managers else [PackageManager.UNKNOWN]
+
+def _run_parser(manager: PackageManager, path: Path) -> AnalysisResult:
+    """Run the manifest parser for a single package manager."""
+    parser = _PARSERS.get(manager)
+    if parser is None:
+        return AnalysisResult(
+            project_path=str(path),
+            package_manager=PackageManager.UNKNOWN,
+            errors=["No supported package manager detected"]
+        )
+    return parser(path)
 
 
 def analyze_project(project_path: str, include_dev: bool = True) -> list[AnalysisResult]:
@@ -402,50 +530,56 @@ def analyze_project(project_path: str, include_dev: bool = True) -> list[Analysi
         )]
 
     managers = detect_package_manager(path)
-    results = []
-
-    for manager in managers:
-        if manager == PackageManager.NPM:
-            result = parse_package_json(path)
-        elif manager == PackageManager.PIP:
-            result = parse_requirements_txt(path)
-        elif manager == PackageManager.GO:
-            result = parse_go_mod(path)
-        elif manager == PackageManager.POETRY:
-            result = parse_pyproject_toml(path)
-        else:
-            result = AnalysisResult(
-                project_path=str(path),
-                package_manager=PackageManager.UNKNOWN,
-                errors=["No supported package manager detected"]
-            )
-
-        # Filter out dev dependencies if not requested
-        if not include_dev:
-            result.dependencies = [d for d in result.dependencies if not d.is_dev]
 
-        results.append(result)
+    # Manifest parsers are independent and mostly I/O bound, so run them
+    # side by side on polyglot repositories; map() keeps detection order
+    if len(managers) > 1:
+        with ThreadPoolExecutor(max_workers=len(managers)) as executor:
+            results = list(executor.map(lambda m: _run_parser(m, path), managers))
+    else:
+        results = [_run_parser(m, path) for m in managers]
+
+    # Filter out dev dependencies if not requested
+    if not include_dev:
+        for result in results:
+            result.dependencies = [d for d in result.dependencies if not d.is_dev]
 
     return results
 
 
+def _partition(
+    result: AnalysisResult,
+    type_counts: Optional[Counter] = None
+) -> tuple[list[Dependency], list[Dependency]]:
+    """Split a result's dependencies into (production, development) lists.
+
+    When type_counts is given, each dependency's type is counted into it in
+    the same pass.
+    """
+    prod_deps = []
+    dev_deps = []
+    for dep in result.dependencies:
+        (dev_deps if dep.is_dev else prod_deps).append(dep)
+        if type_counts is not None:
+            type_counts[dep.dep_type] += 1
+    return prod_deps, dev_deps
+
+
+def _dependency_dict(dep: Dependency) -> dict:
+    """JSON representation of a single dependency."""
+    return {"name": dep.name, "version": dep.version, "type": dep.dep_type}
+
+
 def output_json(results: list[AnalysisResult]) -> str:
     """Format results as JSON."""
     output = []
 
     for result in results:
-        deps = {"production": [], "development": []}
-
-        for dep in result.dependencies:
-            dep_dict = {
-                "name": dep.name,
-                "version": dep.version,
-                "type": dep.dep_type
-            }
-            if dep.is_dev:
-                deps["development"].append(dep_dict)
-            else:
-                deps["production"].append(dep_dict)
+        prod_deps, dev_deps = _partition(result)
+        deps = {
+            "production": [_dependency_dict(dep) for dep in prod_deps],
+            "development": [_dependency_dict(dep) for dep in dev_deps],
+        }
 
         output.append({
             "project_path": result.project_path,
@@ -459,57 +593,54 @@ def output_json(results: list[AnalysisResult]) -> str:
     return json.dumps(output, indent=2)
 
 
+def _write_dependency_table(w: Callable[[str], int], title: str, deps: list[Dependency]) -> None:
+    """Write a sorted Package/Version/Type table section."""
+    w(f"### {title}\n\n"
+      "| Package | Version | Type |\n"
+      "|---------|---------|------|\n")
+    deps.sort(key=attrgetter("name"))
+    for dep in deps:
+        w(f"| {dep.name} | {dep.version} | {dep.dep_type} |\n")
+    w("\n")
+
+
 def output_markdown(results: list[AnalysisResult]) -> str:
     """Format results as Markdown."""
-    lines = ["# Dependency Analysis Report\n"]
+    buf = io.StringIO()
+    w = buf.write
+    w("# Dependency Analysis Report\n")
 
+    # Each project opens with the blank line that separates it from what
+    # comes before, so the report ends right after the closing rule
     for result in results:
-        lines.append(f"## Project: `{result.project_path}`\n")
-        lines.append(f"**Package Manager:** {result.package_manager.value}\n")
+        w(f"\n## Project: `{result.project_path}`\n\n")
+        w(f"**Package Manager:** {result.package_manager.value}\n\n")
 
         if result.errors:
-            lines.append("### Errors\n")
+            w("### Errors\n\n")
             for error in result.errors:
-                lines.append(f"- {error}\n")
-            lines.append("\n")
+                w(f"- {error}\n\n")
+            w("\n\n")
 
-        # Production dependencies
-        prod_deps = [d for d in result.dependencies if not d.is_dev]
-        if prod_deps:
-            lines.append("### Production Dependencies\n")
-            lines.append("| Package | Version | Type |")
-            lines.append("|---------|---------|------|")
-            for dep in sorted(prod_deps, key=lambda x: x.name):
-                lines.append(f"| {dep.name} | {dep.version} | {dep.dep_type} |")
-            lines.append("")
+        type_counts = Counter()
+        prod_deps, dev_deps = _partition(result, type_counts)
 
-        # Development dependencies
-        dev_deps = [d for d in result.dependencies if d.is_dev]
+        if prod_deps:
+            _write_dependency_table(w, "Production Dependencies", prod_deps)
         if dev_deps:
-            lines.append("### Development Dependencies\n")
-            lines.append("| Package | Version | Type |")
-            lines.append("|---------|---------|------|")
-            for dep in sorted(dev_deps, key=lambda x: x.name):
-                lines.append(f"| {dep.name} | {dep.version} | {dep.dep_type} |")
-            lines.append("")
+            _write_dependency_table(w, "Development Dependencies", dev_deps)
 
         # Summary
-        lines.append("### Summary\n")
-        lines.append(f"- Total production dependencies: {len(prod_deps)}")
-        lines.append(f"- Total development dependencies: {len(dev_deps)}")
-
-        # Group by type
-        type_counts = {}
-        for dep in result.dependencies:
-            type_counts[dep.dep_type] = type_counts.get(dep.dep_type, 0) + 1
-
-        lines.append("\n**Dependency Types:**")
+        w("### Summary\n\n"
+          f"- Total production dependencies: {len(prod_deps)}\n"
+          f"- Total development dependencies: {len(dev_deps)}\n"
+          "\n**Dependency Types:**\n")
         for dep_type, count in sorted(type_counts.items()):
-            lines.append(f"- {dep_type}: {count}")
+            w(f"- {dep_type}: {count}\n")
 
-        lines.append("\n---\n")
+        w("\n---\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main():
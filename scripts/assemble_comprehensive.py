@@ -17,6 +17,7 @@ Options:
     --force               Force regeneration, ignore cache
     --quiet               Suppress progress output
     --format FORMAT       Output format for status (markdown/json)
+    --compact             Emit JSON status without indentation
     --help                Show usage information
 
 Exit Codes:
@@ -27,13 +28,32 @@ Exit Codes:
 
 import argparse
 import datetime
+import hashlib
+import heapq
+import io
 import json
+import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass, field
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import cached_property, lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Mapping, Optional
+
+from assemble_document import get_codebase_version
+
+# Document validators run in-process when the sibling modules are importable
+try:
+    import validate_mermaid
+    import verify_paths
+    IN_PROCESS_VALIDATION = True
+except ImportError:
+    IN_PROCESS_VALIDATION = False
 
 
 @dataclass
@@ -95,127 +115,248 @@ class AssemblyResult:
 SCRIPT_DIR = Path(__file__).parent
 TEMPLATE_DIR = SCRIPT_DIR.parent / "templates"
 
+# Patterns for extracting sections from the architecture document
+_PURPOSE_RE = re.compile(
+    r'(?:## 1\..*?|## 2\..*?)(?:System Purpose|Purpose|Description)\s*\n(.*?)(?=\n##|\n###|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+_ACTORS_RE = re.compile(r'(?:Actor|User|Person).*?\n(.*?)(?=\n##|\n###|\Z)', re.DOTALL | re.IGNORECASE)
+_CAPABILITIES_RE = re.compile(r'(?:Capabilities|Key Features|Features)\s*\n(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
+_INTEGRATIONS_RE = re.compile(r'(?:External|Integration|Systems).*?\n(.*?)(?=\n##|\Z)', re.DOTALL | re.IGNORECASE)
+_DEV_GUIDE_RE = re.compile(
+    r'(?:Developer Guide|Getting Started|Prerequisites).*?\n(.*?)(?=\n##|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+_BULLET_RE = re.compile(r'[-*]\s+(.+)')
+
+# Markdown table headers for generated sections
+TECH_STACK_TABLE_HEADER = "| Category | Technology | Version |\n|----------|------------|---------|"
+KEY_METRICS_TABLE_HEADER = "| Metric | Value |\n|--------|-------|"
+ENV_VARS_TABLE_HEADER = "| Variable | Purpose | Required | Default |\n|----------|---------|----------|---------|"
+TECH_DEBT_TABLE_HEADER = "| Issue | Severity | Location | Suggested Fix |\n|-------|----------|----------|---------------|"
+
+# Tech stack table rows: (row label, detect_tech_stack category)
+TECH_STACK_CATEGORIES = (
+    ("Language", "languages"),
+    ("Framework", "frameworks"),
+    ("Database", "databases"),
+    ("Tool", "tools"),
+)
+
+# Dates and ISO timestamps stamped into generated documents
+_TIMESTAMP_RE = re.compile(rb'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?')
+
+# Template placeholders: [PROJECT_NAME], [YYYY-MM-DD], ...
+_PLACEHOLDER_RE = re.compile(r'\[([A-Z0-9_-]+)\]')
+# Unfilled placeholders stripped from the finished document
+_UNFILLED_PLACEHOLDER_RE = re.compile(r'\[[A-Z_0-9]+\]')
+
+# Technical terms rewritten in business language, keyed by lowercase term
+TECH_TERM_REPLACEMENTS = {
+    "microservice": "integrated",
+    "api": "interface",
+    "database": "data storage",
+    "rest": "web",
+    "graphql": "query",
+}
+_TECH_TERM_RE = re.compile(r'\b(' + '|'.join(TECH_TERM_REPLACEMENTS) + r')\b', re.IGNORECASE)
+
+# Generated documents are written in one go; a large buffer keeps that to a
+# handful of write() calls. Newlines are pinned so output matches across OSes.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Fallback values for template placeholders the generators left unfilled
+STATIC_PLACEHOLDER_DEFAULTS = {
+    "SYSTEM_PURPOSE_DESCRIPTION": "System purpose not yet documented.",
+    "CAPABILITY_1_NAME": "Feature 1",
+    "CAPABILITY_1_DESCRIPTION": "Description pending.",
+    "CAPABILITY_2_NAME": "Feature 2",
+    "CAPABILITY_2_DESCRIPTION": "Description pending.",
+    "CAPABILITY_3_NAME": "Feature 3",
+    "CAPABILITY_3_DESCRIPTION": "Description pending.",
+    "CAPABILITY_4_NAME": "Feature 4",
+    "CAPABILITY_4_DESCRIPTION": "Description pending.",
+    "ARCHITECTURE_PATTERN": "Not detected",
+    "KEY_DECISIONS": "Pending analysis",
+    "EXTERNAL_DEPENDENCIES": "Pending analysis",
+    "FILES_COUNT": "N/A",
+    "DESC_COVERAGE": "0",
+    "COMP_COVERAGE": "0",
+    "FEATURE_COVERAGE": "0",
+}
+
+
+# Product overview template placeholders
+_CHALLENGE_PLACEHOLDER_RE = re.compile(r'\[Describe the business problem.*?\]', re.DOTALL)
+_SOLUTION_PLACEHOLDER_RE = re.compile(r'\[Explain what the system does.*?\]', re.DOTALL)
+
+
+def fill_placeholders(content: str, values: Mapping) -> str:
+    """Replace every [KEY] placeholder found in values in a single scan.
+
+    Placeholders without an entry are left untouched; dict and list values
+    are rendered as indented JSON.
+    """
+    def substitute(match: re.Match) -> str:
+        key = match.group(1)
+        if key not in values:
+            return match.group(0)
+        value = values[key]
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, indent=2)
+        return str(value)
 
-def get_codebase_version(codebase_path: Path) -> str:
-    """Get git commit info if available."""
-    try:
-        commit = subprocess.check_output(
-            ['git', 'rev-parse', '--short', 'HEAD'],
-            cwd=codebase_path,
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
+    return _PLACEHOLDER_RE.sub(substitute, content)
 
-        branch = subprocess.check_output(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            cwd=codebase_path,
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
 
-        return f"{commit} ({branch})"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return "Unknown (not a git repository)"
+# Directories searched for each manifest, in priority order
+MANIFEST_SEARCH_DIRS = {
+    "package.json": ('', 'backend', 'frontend', 'server', 'api', 'src'),
+    "requirements.txt": ('', 'backend', 'server', 'api', 'src'),
+    "pyproject.toml": ('', 'backend', 'server', 'api', 'src'),
+    "go.mod": ('',),
+}
+
+
+def locate_manifests(codebase_path: Path) -> dict[str, Path]:
+    """Find the first search directory containing each manifest file.
+
+    Each candidate directory is listed once with os.scandir instead of
+    probing every manifest path with its own stat() call.
+    """
+    found = {}
+    subdirs = dict.fromkeys(d for dirs in MANIFEST_SEARCH_DIRS.values() for d in dirs)
+    for subdir in subdirs:
+        base = codebase_path / subdir if subdir else codebase_path
+        try:
+            with os.scandir(base) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        for manifest, search_dirs in MANIFEST_SEARCH_DIRS.items():
+            if manifest not in found and manifest in names and subdir in search_dirs:
+                found[manifest] = base / manifest
+    return found
+
+
+# package.json dependency names that identify a technology:
+# (tech-stack category, label, package names). Labels are interned (names
+# such as "Next.js" are not interned automatically) so the ordered-set dicts
+# in detect_tech_stack match them by identity.
+NODE_TECH_MARKERS = tuple(
+    (category, sys.intern(label), packages)
+    for category, label, packages in (
+        ("frameworks", "React", frozenset({"react", "react-dom"})),
+        ("frameworks", "Next.js", frozenset({"next"})),
+        ("frameworks", "Express", frozenset({"express"})),
+        ("languages", "TypeScript", frozenset({"typescript"})),
+        ("tools", "Prisma", frozenset({"prisma", "@prisma/client"})),
+    )
+)
+
+
+# requirements.txt substrings that identify a technology:
+# (tech-stack category, label, substrings)
+PYTHON_TECH_MARKERS = tuple(
+    (category, sys.intern(label), needles)
+    for category, label, needles in (
+        ("frameworks", "FastAPI", ("fastapi",)),
+        ("frameworks", "Flask", ("flask",)),
+        ("frameworks", "Django", ("django",)),
+        ("tools", "SQLAlchemy", ("sqlalchemy",)),
+        ("databases", "PostgreSQL", ("psycopg", "postgres")),
+        ("databases", "Redis", ("redis",)),
+    )
+)
 
 
 def detect_tech_stack(codebase_path: Path) -> dict:
     """Detect technology stack and return as structured data."""
-    tech = {
-        "languages": [],
-        "frameworks": [],
-        "databases": [],
-        "tools": [],
-        "summary": ""
+    # Insertion-ordered dicts act as ordered sets while detecting
+    found = {
+        "languages": {},
+        "frameworks": {},
+        "databases": {},
+        "tools": {},
     }
 
+    manifests = locate_manifests(codebase_path)
+
     # Check for package.json (Node.js)
-    for subdir in ['', 'backend', 'frontend', 'server', 'api', 'src']:
-        check_path = codebase_path / subdir / "package.json" if subdir else codebase_path / "package.json"
-        if check_path.exists():
-            if "Node.js" not in tech["languages"]:
-                tech["languages"].append("Node.js")
-            try:
-                with open(check_path) as f:
-                    data = json.load(f)
-                deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-
-                if "react" in str(deps).lower():
-                    tech["frameworks"].append("React")
-                if "next" in str(deps).lower():
-                    tech["frameworks"].append("Next.js")
-                if "express" in str(deps).lower():
-                    tech["frameworks"].append("Express")
-                if "typescript" in str(deps).lower():
-                    if "TypeScript" not in tech["languages"]:
-                        tech["languages"].append("TypeScript")
-                if "prisma" in str(deps).lower():
-                    tech["tools"].append("Prisma")
-            except:
-                pass
-            break
+    check_path = manifests.get("package.json")
+    if check_path:
+        found["languages"]["Node.js"] = None
+        try:
+            data = json.loads(check_path.read_bytes())
+            deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+            dep_names = {name.lower() for name in deps}
+
+            for category, label, packages in NODE_TECH_MARKERS:
+                if not dep_names.isdisjoint(packages):
+                    found[category][label] = None
+        except (OSError, ValueError, AttributeError, TypeError):  # unreadable or malformed manifest
+            pass
 
     # Check for requirements.txt (Python)
-    for subdir in ['', 'backend', 'server', 'api', 'src']:
-        check_path = codebase_path / subdir / "requirements.txt" if subdir else codebase_path / "requirements.txt"
-        if check_path.exists():
-            if "Python" not in tech["languages"]:
-                tech["languages"].append("Python")
-            try:
-                with open(check_path) as f:
-                    content = f.read().lower()
-                if "fastapi" in content:
-                    tech["frameworks"].append("FastAPI")
-                if "flask" in content:
-                    tech["frameworks"].append("Flask")
-                if "django" in content:
-                    tech["frameworks"].append("Django")
-                if "sqlalchemy" in content:
-                    tech["tools"].append("SQLAlchemy")
-                if "psycopg" in content or "postgres" in content:
-                    if "PostgreSQL" not in tech["databases"]:
-                        tech["databases"].append("PostgreSQL")
-                if "redis" in content:
-                    if "Redis" not in tech["databases"]:
-                        tech["databases"].append("Redis")
-            except:
-                pass
-            break
+    check_path = manifests.get("requirements.txt")
+    if check_path:
+        found["languages"]["Python"] = None
+        try:
+            # Scan line by line and stop once every marker has matched
+            pending = set(range(len(PYTHON_TECH_MARKERS)))
+            with open(check_path) as f:
+                for line in f:
+                    line = line.lower()
+                    for i in list(pending):
+                        if any(needle in line for needle in PYTHON_TECH_MARKERS[i][2]):
+                            pending.discard(i)
+                    if not pending:
+                        break
+
+            for i, (category, label, _) in enumerate(PYTHON_TECH_MARKERS):
+                if i not in pending:
+                    found[category][label] = None
+        except (OSError, ValueError):
+            pass
 
     # Check for pyproject.toml
-    for subdir in ['', 'backend', 'server', 'api', 'src']:
-        check_path = codebase_path / subdir / "pyproject.toml" if subdir else codebase_path / "pyproject.toml"
-        if check_path.exists():
-            if "Python" not in tech["languages"]:
-                tech["languages"].append("Python")
-            break
+    if "pyproject.toml" in manifests:
+        found["languages"]["Python"] = None
 
     # Check for go.mod (Go)
-    if (codebase_path / "go.mod").exists():
-        if "Go" not in tech["languages"]:
-            tech["languages"].append("Go")
-
-    # Build summary
-    all_tech = tech["languages"] + tech["frameworks"] + tech["databases"] + tech["tools"]
-    # Remove duplicates while preserving order
-    seen = set()
-    unique = []
-    for t in all_tech:
-        if t not in seen:
-            seen.add(t)
-            unique.append(t)
+    if "go.mod" in manifests:
+        found["languages"]["Go"] = None
+
+    tech = {category: list(labels) for category, labels in found.items()}
+
+    # Build summary, dropping labels repeated across categories
+    unique = dict.fromkeys(chain.from_iterable(found.values()))
     tech["summary"] = " · ".join(unique) if unique else "Unknown"
 
     return tech
 
 
-def load_product_overview_template() -> str:
-    """Load the product overview template."""
-    template_path = TEMPLATE_DIR / "product-overview-template.md"
+@lru_cache(maxsize=16)
+def read_template(template_path: Path) -> str:
+    """Read a template file, caching its content for the process lifetime."""
     if template_path.exists():
         with open(template_path, encoding='utf-8') as f:
             return f.read()
     return ""
 
 
-def generate_product_overview(architecture_content: str, project_name: str, tech_stack: dict, results: AnalysisResults) -> str:
+def load_product_overview_template() -> str:
+    """Load the product overview template."""
+    return read_template(TEMPLATE_DIR / "product-overview-template.md")
+
+
+def generate_product_overview(
+    architecture_content: str,
+    project_name: str,
+    tech_stack: dict,
+    results: AnalysisResults,
+    now: Optional[datetime.datetime] = None
+) -> str:
     """
     Generate business-focused product overview from technical architecture.
 
@@ -224,19 +365,22 @@ def generate_product_overview(architecture_content: str, project_name: str, tech
         project_name: Project name
         tech_stack: Detected technology stack
         results: Analysis results from other phases
+        now: Generation time to stamp (default: current time)
 
     Returns:
         Product overview document content
     """
+    now = now or datetime.datetime.now()
     template = load_product_overview_template()
 
     if not template:
-        return generate_fallback_product_overview(project_name, tech_stack, results)
+        return generate_fallback_product_overview(project_name, tech_stack, results, now)
 
     # Replace basic placeholders
-    content = template
-    content = content.replace("[PROJECT_NAME]", project_name)
-    content = content.replace("[DATE]", datetime.datetime.now().strftime("%Y-%m-%d"))
+    content = fill_placeholders(template, {
+        "PROJECT_NAME": project_name,
+        "DATE": now.strftime("%Y-%m-%d"),
+    })
 
     # Extract and transform content
     content = populate_what_is_section(content, architecture_content, project_name)
@@ -253,11 +397,7 @@ def generate_product_overview(architecture_content: str, project_name: str, tech
 def populate_what_is_section(content: str, arch_content: str, project_name: str) -> str:
     """Populate 'What is [PROJECT_NAME]?' section from architecture."""
     # Extract system purpose from Section 1 or 2
-    purpose_match = re.search(
-        r'(?:## 1\..*?|## 2\..*?)(?:System Purpose|Purpose|Description)\s*\n(.*?)(?=\n##|\n###|\Z)',
-        arch_content,
-        re.DOTALL | re.IGNORECASE
-    )
+    purpose_match = _PURPOSE_RE.search(arch_content)
 
     if purpose_match:
         purpose_text = purpose_match.group(1).strip()
@@ -271,18 +411,8 @@ def populate_what_is_section(content: str, arch_content: str, project_name: str)
         value = ["Improved efficiency", "Better decision-making", "Reduced manual effort"]
 
     # Replace placeholder sections
-    content = re.sub(
-        r'\[Describe the business problem.*?\]',
-        challenge,
-        content,
-        flags=re.DOTALL
-    )
-    content = re.sub(
-        r'\[Explain what the system does.*?\]',
-        solution,
-        content,
-        flags=re.DOTALL
-    )
+    content = _CHALLENGE_PLACEHOLDER_RE.sub(challenge, content)
+    content = _SOLUTION_PLACEHOLDER_RE.sub(solution, content)
 
     return content
 
@@ -290,11 +420,7 @@ def populate_what_is_section(content: str, arch_content: str, project_name: str)
 def populate_who_is_section(content: str, arch_content: str) -> str:
     """Populate 'Who is [PROJECT_NAME] For?' section."""
     # Extract user/actor information from architecture
-    actors_match = re.search(
-        r'(?:Actor|User|Person).*?\n(.*?)(?=\n##|\n###|\Z)',
-        arch_content,
-        re.DOTALL | re.IGNORECASE
-    )
+    actors_match = _ACTORS_RE.search(arch_content)
 
     # Default personas if not found
     if not actors_match:
@@ -318,14 +444,10 @@ def populate_features_section(content: str, arch_content: str, results: Analysis
 
     # Try to get from capabilities section
     if not features:
-        caps_match = re.search(
-            r'(?:Capabilities|Key Features|Features)\s*\n(.*?)(?=\n##|\Z)',
-            arch_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        caps_match = _CAPABILITIES_RE.search(arch_content)
         if caps_match:
             # Extract bullet points
-            bullets = re.findall(r'[-*]\s+(.+)', caps_match.group(1))
+            bullets = _BULLET_RE.findall(caps_match.group(1))
             for bullet in bullets[:8]:
                 features.append({
                     "name": bullet.split(':')[0].strip() if ':' in bullet else bullet[:50],
@@ -338,11 +460,7 @@ def populate_features_section(content: str, arch_content: str, results: Analysis
 def populate_integrations_section(content: str, arch_content: str) -> str:
     """Populate integrations section from architecture."""
     # Extract external systems from context diagram or integrations section
-    integrations_match = re.search(
-        r'(?:External|Integration|Systems).*?\n(.*?)(?=\n##|\Z)',
-        arch_content,
-        re.DOTALL | re.IGNORECASE
-    )
+    integrations_match = _INTEGRATIONS_RE.search(arch_content)
 
     return content
 
@@ -362,33 +480,15 @@ def populate_use_cases_section(content: str, arch_content: str, project_name: st
 def populate_getting_started_section(content: str, arch_content: str) -> str:
     """Populate getting started section from developer guide."""
     # Extract developer guide information
-    dev_guide_match = re.search(
-        r'(?:Developer Guide|Getting Started|Prerequisites).*?\n(.*?)(?=\n##|\Z)',
-        arch_content,
-        re.DOTALL | re.IGNORECASE
-    )
+    dev_guide_match = _DEV_GUIDE_RE.search(arch_content)
 
     return content
 
 
 def transform_to_challenge(technical_text: str) -> str:
     """Transform technical description to business challenge."""
-    # Simple transformations
-    text = technical_text
-
-    # Replace technical terms
-    replacements = {
-        "microservice": "integrated",
-        "API": "interface",
-        "database": "data storage",
-        "REST": "web",
-        "GraphQL": "query",
-    }
-
-    for tech, business in replacements.items():
-        text = re.sub(tech, business, text, flags=re.IGNORECASE)
-
-    return text
+    # Replace technical terms in a single pass over the text
+    return _TECH_TERM_RE.sub(lambda m: TECH_TERM_REPLACEMENTS[m.group(1).lower()], technical_text)
 
 
 def transform_to_solution(technical_text: str) -> str:
@@ -399,17 +499,23 @@ def transform_to_solution(technical_text: str) -> str:
 def extract_value_points(text: str) -> list:
     """Extract value points from text."""
     # Look for bullet points or benefits
-    bullets = re.findall(r'[-*]\s+(.+)', text)
+    bullets = _BULLET_RE.findall(text)
     if bullets:
         return bullets[:5]
     return ["Improved efficiency", "Better outcomes", "Reduced costs"]
 
 
-def generate_fallback_product_overview(project_name: str, tech_stack: dict, results: AnalysisResults) -> str:
+def generate_fallback_product_overview(
+    project_name: str,
+    tech_stack: dict,
+    results: AnalysisResults,
+    now: Optional[datetime.datetime] = None
+) -> str:
     """Generate basic product overview if template not found."""
+    now = now or datetime.datetime.now()
     return f"""# {project_name} Product Overview
 
-**Generated**: {datetime.datetime.now().strftime("%Y-%m-%d")}
+**Generated**: {now.strftime("%Y-%m-%d")}
 **Version**: 1.0
 **Audience**: Business Stakeholders, Executives, Clients
 
@@ -605,8 +711,7 @@ def load_cache_results(cache_dir: Path) -> AnalysisResults:
     for key, path in cache_files.items():
         if path.exists():
             try:
-                with open(path) as f:
-                    setattr(results, key, json.load(f))
+                setattr(results, key, json.loads(path.read_bytes()))
             except (json.JSONDecodeError, IOError):
                 pass
 
@@ -621,19 +726,56 @@ def run_script(script_name: str, args: list[str]) -> tuple[int, str, str]:
         return -1, "", f"Script not found: {script_path}"
 
     try:
+        # Capture raw bytes and decode once at the end rather than running
+        # the pipes through an incremental text decoder
         result = subprocess.run(
             [sys.executable, str(script_path)] + args,
             capture_output=True,
-            text=True,
             timeout=120
         )
-        return result.returncode, result.stdout, result.stderr
+        return (
+            result.returncode,
+            result.stdout.decode('utf-8', errors='replace'),
+            result.stderr.decode('utf-8', errors='replace'),
+        )
     except subprocess.TimeoutExpired:
         return -1, "", "Script timed out"
     except Exception as e:
         return -1, "", str(e)
 
 
+def _script_summary(script_name: str, args: list[str], keys: tuple) -> Optional[dict]:
+    """Selected "summary" counts from a validator script's JSON output."""
+    code, stdout, stderr = run_script(script_name, args)
+    if code < 0 or not stdout:
+        return None
+    try:
+        summary = json.loads(stdout).get("summary", {})
+    except json.JSONDecodeError:
+        return {"error": "Failed to parse output"}
+    return {key: summary.get(key, 0) for key in keys}
+
+
+def _verify_paths_summary(document_path: str, codebase_path: str) -> Optional[dict]:
+    """Path verification counts, computed in this process."""
+    try:
+        result = verify_paths.verify_paths(
+            document_path, codebase_path, verify_paths.DEFAULT_IGNORE_PATTERNS
+        )
+    except (SystemExit, Exception):  # the validator exits on unreadable inputs
+        return None
+    return {"total": result.total, "found": result.found, "missing": result.missing}
+
+
+def _mermaid_summary(document_path: str) -> Optional[dict]:
+    """Mermaid validation counts, computed in this process."""
+    try:
+        result = validate_mermaid.validate_document(document_path)
+    except (SystemExit, Exception):  # the validator exits on unreadable inputs
+        return None
+    return {"total": result.total, "valid": result.valid, "invalid": result.invalid}
+
+
 def run_validations(document_path: str, codebase_path: str, skip: bool = False) -> ValidationReport:
     """Run all validation scripts."""
     report = ValidationReport()
@@ -641,40 +783,39 @@ def run_validations(document_path: str, codebase_path: str, skip: bool = False)
     if skip:
         return report
 
+    # The validators are independent; start them together so the total wait
+    # is the slowest one rather than the sum. Path and diagram checks only
+    # read the generated document, so they run in this process and skip an
+    # interpreter startup each. Schema analysis walks the whole codebase and
+    # keeps its own process so it doesn't compete for the GIL. All of them
+    # are skipped entirely on cache hits.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        schema_job = executor.submit(run_script, "schema_analysis.py", [
+            codebase_path, "--completeness", "--format", "json"
+        ])
+        if IN_PROCESS_VALIDATION:
+            paths_job = executor.submit(_verify_paths_summary, document_path, codebase_path)
+            mermaid_job = executor.submit(_mermaid_summary, document_path)
+        else:
+            paths_job = executor.submit(_script_summary, "verify_paths.py", [
+                document_path, codebase_path, "--format", "json"
+            ], ("total", "found", "missing"))
+            mermaid_job = executor.submit(_script_summary, "validate_mermaid.py", [
+                document_path, "--format", "json"
+            ], ("total", "valid", "invalid"))
+
     # Path verification
-    code, stdout, stderr = run_script("verify_paths.py", [
-        document_path, codebase_path, "--format", "json"
-    ])
-    if code >= 0 and stdout:
-        try:
-            data = json.loads(stdout)
-            report.path_verification = {
-                "total": data.get("summary", {}).get("total", 0),
-                "found": data.get("summary", {}).get("found", 0),
-                "missing": data.get("summary", {}).get("missing", 0),
-            }
-        except json.JSONDecodeError:
-            report.path_verification = {"error": "Failed to parse output"}
+    summary = paths_job.result()
+    if summary is not None:
+        report.path_verification = summary
 
     # Mermaid validation
-    code, stdout, stderr = run_script("validate_mermaid.py", [
-        document_path, "--format", "json"
-    ])
-    if code >= 0 and stdout:
-        try:
-            data = json.loads(stdout)
-            report.mermaid_validation = {
-                "total": data.get("summary", {}).get("total", 0),
-                "valid": data.get("summary", {}).get("valid", 0),
-                "invalid": data.get("summary", {}).get("invalid", 0),
-            }
-        except json.JSONDecodeError:
-            report.mermaid_validation = {"error": "Failed to parse output"}
+    summary = mermaid_job.result()
+    if summary is not None:
+        report.mermaid_validation = summary
 
     # Schema completeness
-    code, stdout, stderr = run_script("schema_analysis.py", [
-        codebase_path, "--completeness", "--format", "json"
-    ])
+    code, stdout, stderr = schema_job.result()
     if code >= 0 and stdout:
         try:
             data = json.loads(stdout)
@@ -690,6 +831,59 @@ def run_validations(document_path: str, codebase_path: str, skip: bool = False)
     return report
 
 
+def validation_cache_key(document_path: Path, codebase_path: Path, exclude: tuple = ()) -> Optional[str]:
+    """
+    Key identifying the inputs of run_validations.
+
+    Combines the document content (with dates/timestamps masked, since every
+    regeneration stamps new ones) and the codebase commit. Returns None when
+    the codebase is not a git checkout or has uncommitted changes outside the
+    excluded paths, because its state cannot then be pinned to a commit.
+    """
+    pathspec = ['.'] + [f":(exclude){path}" for path in exclude]
+    try:
+        status = subprocess.check_output(
+            ['git', 'status', '--porcelain=v2', '--branch', '--'] + pathspec,
+            cwd=codebase_path,
+            stderr=subprocess.DEVNULL
+        )
+        document = document_path.read_bytes()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+    # Header lines start with '#'; anything else is a changed or untracked path
+    if any(not line.startswith(b'#') for line in status.splitlines()):
+        return None
+
+    digest = hashlib.blake2b(_TIMESTAMP_RE.sub(b'', document), digest_size=16)
+    digest.update(status)
+    return digest.hexdigest()
+
+
+def load_cached_validation(cache_dir: Path, key: str) -> Optional[ValidationReport]:
+    """Load a stored validation report, or None if absent or unreadable."""
+    try:
+        return ValidationReport(**json.loads((cache_dir / f"{key}.json").read_bytes()))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def store_validation(cache_dir: Path, key: str, report: ValidationReport) -> None:
+    """Persist a validation report for reuse by later runs."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_dir / f"{key}.json", 'w', encoding='utf-8') as f:
+            json.dump(asdict(report), f, indent=2)
+    except OSError:
+        pass
+
+
+def write_document(path: Path, content: str) -> None:
+    """Write a generated document in one buffered call."""
+    with open(path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE, newline='\n') as f:
+        f.write(content)
+
+
 class DocumentAssembler:
     """Assembles comprehensive documentation from analysis results."""
 
@@ -698,86 +892,84 @@ class DocumentAssembler:
         self.results = AnalysisResults()
         self.tech_stack = {}
         self.codebase_version = ""
+        # Generation time stamped into documents; reset by each assemble()
+        self.now = datetime.datetime.now()
+
+        # --force must pick up template edits made since the last load
+        if config.force:
+            read_template.cache_clear()
 
     def load_analysis_results(self):
         """Load all analysis results from cache."""
         cache_dir = self.config.project_path / ".audit_cache"
         self.results = load_cache_results(cache_dir)
+        # Drop partitions computed from previously loaded results
+        self.__dict__.pop("components_by_layer", None)
 
     def load_template(self, name: str = "comprehensive-template.md") -> str:
         """Load template file."""
-        template_path = self.config.template_path or (TEMPLATE_DIR / name)
-        if template_path.exists():
-            with open(template_path) as f:
-                return f.read()
-        return ""
+        return read_template(self.config.template_path or (TEMPLATE_DIR / name))
 
     def inject_section(self, content: str, placeholder: str, value: Any) -> str:
-        """Replace placeholder with value."""
+        """Replace placeholder with value.
+
+        A plain substring replace, no regex involved. To fill several keys,
+        use fill_placeholders, which shares one compiled pattern and scans
+        the content once.
+        """
         if isinstance(value, (dict, list)):
             value = json.dumps(value, indent=2)
         return content.replace(f"[{placeholder}]", str(value))
 
     def generate_tech_stack_table(self) -> str:
         """Generate tech stack table."""
-        lines = ["| Category | Technology | Version |", "|----------|------------|---------|"]
-
-        for lang in self.tech_stack.get("languages", []):
-            lines.append(f"| Language | {lang} | - |")
-        for fw in self.tech_stack.get("frameworks", []):
-            lines.append(f"| Framework | {fw} | - |")
-        for db in self.tech_stack.get("databases", []):
-            lines.append(f"| Database | {db} | - |")
-        for tool in self.tech_stack.get("tools", []):
-            lines.append(f"| Tool | {tool} | - |")
+        lines = [TECH_STACK_TABLE_HEADER]
+        for label, key in TECH_STACK_CATEGORIES:
+            lines.extend(f"| {label} | {name} | - |" for name in self.tech_stack.get(key, []))
 
         return "\n".join(lines)
 
     def generate_key_metrics_table(self) -> str:
         """Generate key metrics table."""
-        lines = ["| Metric | Value |", "|--------|-------|"]
-
         # Try to get metrics from results
         total_files = self.results.environment.get("total_files", "N/A")
         components = len(self.results.components.get("components", []))
         endpoints = len(self.results.features.get("endpoints", []))
         tables = len(self.results.database.get("tables", []))
 
-        lines.append(f"| Total Files | {total_files} |")
-        lines.append(f"| Components | {components} |")
-        lines.append(f"| API Endpoints | {endpoints} |")
-        lines.append(f"| Database Tables | {tables} |")
-
-        return "\n".join(lines)
+        return (
+            f"{KEY_METRICS_TABLE_HEADER}\n"
+            f"| Total Files | {total_files} |\n"
+            f"| Components | {components} |\n"
+            f"| API Endpoints | {endpoints} |\n"
+            f"| Database Tables | {tables} |"
+        )
 
     def generate_entity_json(self) -> str:
         """Generate entity relationships JSON from database results."""
-        entities = []
-
-        for table in self.results.database.get("tables", []):
-            entity = {
+        entities = [
+            {
                 "name": table.get("name", "unknown"),
                 "table": table.get("name", "unknown"),
                 "primary_key": table.get("primary_key", "id"),
                 "fields": [col.get("name") for col in table.get("columns", [])],
-                "relations": {}
-            }
-            # Add relationships
-            for fk in table.get("foreign_keys", []):
-                entity["relations"][fk.get("column")] = {
-                    "type": "belongsTo",
-                    "target": fk.get("references_table")
+                "relations": {
+                    fk.get("column"): {
+                        "type": "belongsTo",
+                        "target": fk.get("references_table")
+                    }
+                    for fk in table.get("foreign_keys", [])
                 }
-            entities.append(entity)
+            }
+            for table in self.results.database.get("tables", [])
+        ]
 
         return json.dumps({"entities": entities}, indent=2)
 
     def generate_endpoint_json(self) -> str:
         """Generate API endpoints JSON from feature results."""
-        endpoints = []
-
-        for ep in self.results.features.get("endpoints", []):
-            endpoint = {
+        endpoints = [
+            {
                 "method": ep.get("method", "GET"),
                 "path": ep.get("path", "/"),
                 "handler": ep.get("handler", ""),
@@ -785,17 +977,28 @@ class DocumentAssembler:
                 "request_schema": ep.get("request_schema", ""),
                 "response_schema": ep.get("response_schema", "")
             }
-            endpoints.append(endpoint)
+            for ep in self.results.features.get("endpoints", [])
+        ]
 
         return json.dumps({"endpoints": endpoints}, indent=2)
 
+    @cached_property
+    def components_by_layer(self) -> dict[str, list[dict]]:
+        """Controller and service components, partitioned in a single pass."""
+        groups = {"controller": [], "service": []}
+        for component in self.results.components.get("components", []):
+            layer = component.get("layer", "").lower()
+            for name, members in groups.items():
+                if name in layer:
+                    members.append(component)
+        return groups
+
     def generate_component_summary(self) -> str:
         """Generate component summary for AI reference."""
         lines = []
 
         # Controllers
-        controllers = [c for c in self.results.components.get("components", [])
-                       if "controller" in c.get("layer", "").lower()]
+        controllers = self.components_by_layer["controller"]
         if controllers:
             lines.append("Controllers:")
             for c in controllers:
@@ -803,8 +1006,7 @@ class DocumentAssembler:
                 lines.append(f"- {c.get('name')}: {methods}")
 
         # Services
-        services = [c for c in self.results.components.get("components", [])
-                    if "service" in c.get("layer", "").lower()]
+        services = self.components_by_layer["service"]
         if services:
             lines.append("\nServices:")
             for s in services:
@@ -823,72 +1025,91 @@ class DocumentAssembler:
         # Generate basic structure
         lines = [f"{self.config.project_name}/"]
         try:
-            for item in sorted(self.config.project_path.iterdir())[:20]:
-                if item.is_dir() and not item.name.startswith('.'):
-                    lines.append(f"├── {item}/")
-                elif item.is_file() and not item.name.startswith('.'):
-                    lines.append(f"├── {item.name}")
-        except:
+            # Only the first 20 names are shown: select them with a bounded
+            # heap instead of sorting the whole listing. DirEntry caches the
+            # file type, so is_dir()/is_file() need no extra stat() calls.
+            with os.scandir(self.config.project_path) as entries:
+                first = heapq.nsmallest(20, entries, key=attrgetter("name"))
+            for entry in first:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    lines.append(f"├── {entry.name}/")
+                elif entry.is_file():
+                    lines.append(f"├── {entry.name}")
+        except OSError:
             pass
         return "\n".join(lines)
 
     def generate_environment_vars_table(self) -> str:
         """Generate environment variables table."""
-        lines = ["| Variable | Purpose | Required | Default |", "|----------|---------|----------|---------|"]
-
         env_vars = self.results.environment.get("environment_variables", [])
-        for var in env_vars[:20]:  # Limit to 20
-            lines.append(
-                f"| {var.get('name', 'N/A')} | {var.get('purpose', '-')} | "
-                f"{'Yes' if var.get('required') else 'No'} | {var.get('default', '-')} |"
-            )
-
         if not env_vars:
-            lines.append("| (none detected) | - | - | - |")
+            return f"{ENV_VARS_TABLE_HEADER}\n| (none detected) | - | - | - |"
 
-        return "\n".join(lines)
+        rows = [
+            f"| {var.get('name', 'N/A')} | {var.get('purpose', '-')} | "
+            f"{'Yes' if var.get('required') else 'No'} | {var.get('default', '-')} |"
+            for var in env_vars[:20]  # Limit to 20
+        ]
+        return "\n".join([ENV_VARS_TABLE_HEADER, *rows])
 
     def generate_technical_debt_table(self) -> str:
         """Generate technical debt table."""
-        lines = ["| Issue | Severity | Location | Suggested Fix |", "|-------|----------|----------|---------------|"]
-
         issues = self.results.technical_debt.get("issues", [])
-        for issue in issues[:15]:  # Limit to 15
-            lines.append(
-                f"| {issue.get('description', 'N/A')[:50]} | {issue.get('severity', 'Medium')} | "
-                f"`{issue.get('location', 'N/A')}` | {issue.get('suggestion', '-')[:30]} |"
-            )
-
         if not issues:
-            lines.append("| (no issues detected) | - | - | - |")
+            return f"{TECH_DEBT_TABLE_HEADER}\n| (no issues detected) | - | - | - |"
 
-        return "\n".join(lines)
+        rows = [
+            f"| {issue.get('description', 'N/A')[:50]} | {issue.get('severity', 'Medium')} | "
+            f"`{issue.get('location', 'N/A')}` | {issue.get('suggestion', '-')[:30]} |"
+            for issue in issues[:15]  # Limit to 15
+        ]
+        return "\n".join([TECH_DEBT_TABLE_HEADER, *rows])
 
     def generate_main_document(self) -> str:
         """Generate the main comprehensive document."""
         template = self.load_template("comprehensive-template.md")
 
         if not template:
+            # Built from f-strings with no placeholders, so it skips the
+            # clearing pass below
             return self._generate_fallback_document()
 
-        # Replace basic placeholders
-        content = template
-        content = self.inject_section(content, "PROJECT_NAME", self.config.project_name)
-        content = self.inject_section(content, "YYYY-MM-DD", datetime.datetime.now().strftime("%Y-%m-%d"))
-        content = self.inject_section(content, "COMMIT_HASH", self.codebase_version)
-        content = self.inject_section(content, "BRANCH", "")
-        content = self.inject_section(content, "TIMESTAMP", datetime.datetime.now().isoformat())
-        content = self.inject_section(content, "TECH_STACK_SUMMARY", self.tech_stack.get("summary", "Unknown"))
-
-        # Generate and inject sections
-        content = self.inject_section(content, "TECH_STACK_TABLE", self.generate_tech_stack_table())
-        content = self.inject_section(content, "KEY_METRICS_TABLE", self.generate_key_metrics_table())
-        content = self.inject_section(content, "PROJECT_STRUCTURE", self.generate_project_structure())
-        content = self.inject_section(content, "ENTITY_JSON_ARRAY", self.generate_entity_json())
-        content = self.inject_section(content, "ENDPOINT_JSON_ARRAY", self.generate_endpoint_json())
-        content = self.inject_section(content, "COMPONENT_SUMMARY", self.generate_component_summary())
-        content = self.inject_section(content, "ENV_VARS_TABLE", self.generate_environment_vars_table())
-        content = self.inject_section(content, "TECH_DEBT_TABLE", self.generate_technical_debt_table())
+        # Section generators, keyed by placeholder. Only the ones the template
+        # actually references are run, so custom templates that omit e.g.
+        # [PROJECT_STRUCTURE] skip the directory scan entirely.
+        generators = {
+            "PROJECT_NAME": lambda: self.config.project_name,
+            "YYYY-MM-DD": lambda: self.now.strftime("%Y-%m-%d"),
+            "COMMIT_HASH": lambda: self.codebase_version,
+            "BRANCH": lambda: "",
+            "TIMESTAMP": lambda: self.now.isoformat(),
+            "TECH_STACK_SUMMARY": lambda: self.tech_stack.get("summary", "Unknown"),
+            "TECH_STACK_TABLE": self.generate_tech_stack_table,
+            "KEY_METRICS_TABLE": self.generate_key_metrics_table,
+            "PROJECT_STRUCTURE": self.generate_project_structure,
+            "ENTITY_JSON_ARRAY": self.generate_entity_json,
+            "ENDPOINT_JSON_ARRAY": self.generate_endpoint_json,
+            "COMPONENT_SUMMARY": self.generate_component_summary,
+            "ENV_VARS_TABLE": self.generate_environment_vars_table,
+            "TECH_DEBT_TABLE": self.generate_technical_debt_table,
+        }
+        present = set(_PLACEHOLDER_RE.findall(template))
+
+        # The directory scan is the only generator that waits on the disk, so
+        # it runs in the background while the in-memory sections are rendered.
+        # The rest are pure Python and would only contend for the GIL.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            structure = None
+            if "PROJECT_STRUCTURE" in present:
+                structure = pool.submit(generators.pop("PROJECT_STRUCTURE"))
+            values = {key: generate() for key, generate in generators.items() if key in present}
+            if structure is not None:
+                values["PROJECT_STRUCTURE"] = structure.result()
+
+        # Replace basic placeholders and generated sections in one pass
+        content = fill_placeholders(template, values)
 
         # Clear remaining placeholders
         content = self._clear_remaining_placeholders(content)
@@ -897,15 +1118,17 @@ class DocumentAssembler:
 
     def _generate_fallback_document(self) -> str:
         """Generate a basic document if template is not found."""
-        return f"""# System Architecture & Logic Reference: {self.config.project_name}
+        name = self.config.project_name
+        tech = self.tech_stack.get("summary", "Unknown")
+        return f"""# System Architecture & Logic Reference: {name}
 
 > **Generated by:** Architecture Audit Agent
-> **Date:** {datetime.datetime.now().strftime("%Y-%m-%d")}
+> **Date:** {self.now.strftime("%Y-%m-%d")}
 > **Codebase Version:** {self.codebase_version}
 
-This document provides a complete technical mapping of **{self.config.project_name}** for AI-driven development and human onboarding.
+This document provides a complete technical mapping of **{name}** for AI-driven development and human onboarding.
 
-**Detected Tech Stack:** {self.tech_stack.get("summary", "Unknown")}
+**Detected Tech Stack:** {tech}
 
 ---
 
@@ -926,197 +1149,248 @@ This document provides a complete technical mapping of **{self.config.project_na
 
     def _clear_remaining_placeholders(self, content: str) -> str:
         """Clear any remaining placeholders."""
-        # Replace common placeholders with empty or default values
-        defaults = {
-            "SYSTEM_PURPOSE_DESCRIPTION": "System purpose not yet documented.",
-            "CAPABILITY_1_NAME": "Feature 1",
-            "CAPABILITY_1_DESCRIPTION": "Description pending.",
-            "CAPABILITY_2_NAME": "Feature 2",
-            "CAPABILITY_2_DESCRIPTION": "Description pending.",
-            "CAPABILITY_3_NAME": "Feature 3",
-            "CAPABILITY_3_DESCRIPTION": "Description pending.",
-            "CAPABILITY_4_NAME": "Feature 4",
-            "CAPABILITY_4_DESCRIPTION": "Description pending.",
-            "ARCHITECTURE_PATTERN": "Not detected",
-            "KEY_DECISIONS": "Pending analysis",
-            "EXTERNAL_DEPENDENCIES": "Pending analysis",
-            "AI_SYSTEM_SUMMARY": f"This is a {self.tech_stack.get('summary', 'software')} application.",
-            "FILES_COUNT": "N/A",
-            "COMPONENTS_COUNT": str(len(self.results.components.get("components", []))),
-            "FEATURES_COUNT": str(len(self.results.features.get("endpoints", []))),
-            "DESC_COVERAGE": "0",
-            "COMP_COVERAGE": "0",
-            "FEATURE_COVERAGE": "0",
+        # Every placeholder starts with '[': a plain substring check rules out
+        # both regex passes when the template has been fully filled
+        if '[' not in content:
+            return content
+
+        tech = self.tech_stack.get('summary', 'software')
+        results = self.results
+
+        # Defaults that depend on this run are only evaluated when the
+        # content still references them
+        dynamic = {
+            "AI_SYSTEM_SUMMARY": lambda: f"This is a {tech} application.",
+            "COMPONENTS_COUNT": lambda: str(len(results.components.get("components", []))),
+            "FEATURES_COUNT": lambda: str(len(results.features.get("endpoints", []))),
         }
+        present = set(_PLACEHOLDER_RE.findall(content))
 
-        for key, value in defaults.items():
-            content = self.inject_section(content, key, value)
+        # Layer the evaluated values over the shared static table instead of
+        # copying it into a fresh dict on every call
+        content = fill_placeholders(content, ChainMap(
+            {key: default() for key, default in dynamic.items() if key in present},
+            STATIC_PLACEHOLDER_DEFAULTS,
+        ))
 
         # Clear any remaining [PLACEHOLDER] patterns
-        content = re.sub(r'\[[A-Z_0-9]+\]', '', content)
+        content = _UNFILLED_PLACEHOLDER_RE.sub('', content)
 
         return content
 
     def generate_index(self, documents: list[str]) -> str:
         """Generate index document with links to all docs, featuring product overview first."""
-        lines = [
-            f"# Documentation Index: {self.config.project_name}",
-            "",
-            f"**Generated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "",
-            "## Available Documents",
-            "",
-        ]
+        # Written straight into one buffer; static runs of lines go in as
+        # single pre-joined blocks
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"# Documentation Index: {self.config.project_name}\n"
+            "\n"
+            f"**Generated:** {self.now.strftime('%Y-%m-%d %H:%M')}\n"
+            "\n"
+            "## Available Documents\n"
+            "\n"
+        )
 
-        # Find product overview document
+        # Classify each document once, checking the kind markers in priority
+        # order so "System-Architecture-DatabaseTool.md" stays an architecture doc
         product_overview = None
         other_docs = []
         for doc in documents:
             if "Product-Overview" in doc:
                 product_overview = doc
+            elif "Architecture" in doc:
+                other_docs.append((doc, "Technical architecture reference"))
+            elif "Database" in doc:
+                other_docs.append((doc, "Database schema documentation"))
             else:
-                other_docs.append(doc)
+                other_docs.append((doc, "Architecture documentation"))
 
         # Feature product overview first if present
         if product_overview:
-            lines.extend([
-                "### 1. Product Overview (Business-Focused)",
-                "",
-                f"**[{product_overview}]({product_overview})**",
-                "",
-                "User-friendly overview for business stakeholders, executives, and clients.",
-                "- What the system does and why it matters",
-                "- Key features and benefits",
-                "- Use cases with measurable outcomes",
-                "- Getting started guide",
-                "",
-                "**Audience**: Business stakeholders, executives, clients, sales/marketing teams",
-                "",
-                "---",
-                "",
-            ])
+            w(
+                "### 1. Product Overview (Business-Focused)\n"
+                "\n"
+                f"**[{product_overview}]({product_overview})**\n"
+                "\n"
+                "User-friendly overview for business stakeholders, executives, and clients.\n"
+                "- What the system does and why it matters\n"
+                "- Key features and benefits\n"
+                "- Use cases with measurable outcomes\n"
+                "- Getting started guide\n"
+                "\n"
+                "**Audience**: Business stakeholders, executives, clients, sales/marketing teams\n"
+                "\n"
+                "---\n"
+                "\n"
+            )
 
         # List other documents
-        lines.extend([
-            "### Technical Documentation",
-            "",
-            "| Document | Description |",
-            "|----------|-------------|",
-        ])
+        w(
+            "### Technical Documentation\n"
+            "\n"
+            "| Document | Description |\n"
+            "|----------|-------------|\n"
+        )
 
-        for doc in other_docs:
-            if "Architecture" in doc:
-                lines.append(f"| [{doc}]({doc}) | Technical architecture reference |")
-            elif "Database" in doc:
-                lines.append(f"| [{doc}]({doc}) | Database schema documentation |")
-            else:
-                lines.append(f"| [{doc}]({doc}) | Architecture documentation |")
+        for doc, description in other_docs:
+            w(f"| [{doc}]({doc}) | {description} |\n")
 
-        lines.extend([
-            "",
-            "## Quick Links",
-            "",
-        ])
+        w(
+            "\n"
+            "## Quick Links\n"
+            "\n"
+        )
 
         if product_overview:
-            lines.append(f"- **For Business Users**: Start with the [Product Overview]({product_overview})")
+            w(f"- **For Business Users**: Start with the [Product Overview]({product_overview})\n")
 
-        arch_doc = other_docs[0] if other_docs else documents[0] if documents else ""
+        arch_doc = other_docs[0][0] if other_docs else documents[0] if documents else ""
         if arch_doc:
-            lines.extend([
-                f"- **For Developers**: [Technical Architecture]({arch_doc})",
-                f"- **For DBAs**: [Database Schema]({arch_doc}#5-data-layer--schema-reference)",
-            ])
-
-        lines.extend([
-            "",
-            "## Document Versions",
-            "",
-            "| Document | Version | Date |",
-            "|----------|---------|------|",
-        ])
+            w(
+                f"- **For Developers**: [Technical Architecture]({arch_doc})\n"
+                f"- **For DBAs**: [Database Schema]({arch_doc}#5-data-layer--schema-reference)\n"
+            )
 
-        for doc in ([product_overview] + other_docs if product_overview else other_docs):
+        w(
+            "\n"
+            "## Document Versions\n"
+            "\n"
+            "| Document | Version | Date |\n"
+            "|----------|---------|------|\n"
+        )
+
+        versioned = [doc for doc, _ in other_docs]
+        if product_overview:
+            versioned.insert(0, product_overview)
+        today = self.now.strftime('%Y-%m-%d')
+        for doc in versioned:
             doc_name = doc.replace(".md", "").replace("-", " ").replace("_", " ")
-            lines.append(f"| {doc_name} | 1.0 | {datetime.datetime.now().strftime('%Y-%m-%d')} |")
+            w(f"| {doc_name} | 1.0 | {today} |\n")
 
-        lines.extend([
-            "",
-            "---",
-            "",
+        w(
+            "\n"
+            "---\n"
+            "\n"
             "*Generated by Architecture Audit Agent*"
-        ])
+        )
 
-        return "\n".join(lines)
+        return buf.getvalue()
+
+    def validate(self, document_path: Path) -> ValidationReport:
+        """Run validations, reusing the stored report for unchanged inputs."""
+        cache_dir = self.config.project_path / ".audit_cache" / "validation"
+
+        # Our own cache and output must not count as codebase changes
+        exclude = [".audit_cache"]
+        try:
+            exclude.append(self.config.output_dir.resolve().relative_to(
+                self.config.project_path.resolve()).as_posix())
+        except ValueError:
+            pass  # output directory lies outside the project
+
+        key = validation_cache_key(document_path, self.config.project_path, tuple(exclude))
+        if key and not self.config.force:
+            cached = load_cached_validation(cache_dir, key)
+            if cached is not None:
+                if not self.config.quiet:
+                    print("Validation: inputs unchanged, reusing previous results")
+                return cached
+
+        report = run_validations(str(document_path), str(self.config.project_path))
+        if key:
+            store_validation(cache_dir, key, report)
+        return report
 
     def assemble(self) -> AssemblyResult:
         """Assemble all documents."""
         errors = []
         documents = []
 
+        # Every document from this run shares one generation time
+        self.now = datetime.datetime.now()
+
         # Load analysis results
         self.load_analysis_results()
 
         # Get metadata
         self.codebase_version = get_codebase_version(self.config.project_path)
         self.tech_stack = detect_tech_stack(self.config.project_path)
-        generated_at = datetime.datetime.now().isoformat()
+        generated_at = self.now.isoformat()
 
         # Create output directory
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate main document
-        main_content = ""
-        try:
-            main_content = self.generate_main_document()
-            main_filename = f"System-Architecture-{self.config.project_name}.md"
-            main_path = self.config.output_dir / main_filename
-
-            with open(main_path, 'w', encoding='utf-8') as f:
-                f.write(main_content)
-
-            documents.append(main_filename)
-            if not self.config.quiet:
-                print(f"Generated: {main_path}")
-        except Exception as e:
-            errors.append(f"Failed to generate main document: {e}")
-
-        # Generate Product Overview (Phase 10) - NEW
-        if not self.config.skip_product_overview and main_content:
+        main_filename = f"System-Architecture-{self.config.project_name}.md"
+        main_path = self.config.output_dir / main_filename
+        product_filename = f"{self.config.project_name}-Product-Overview.md"
+        product_path = self.config.output_dir / product_filename
+
+        # Documents are written on a background thread so the main document
+        # reaches the disk while the product overview is being generated
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            # Generate main document
+            main_content = ""
+            main_write = None
             try:
-                if not self.config.quiet:
-                    print("\nPhase 10: Generating Product Overview...")
-
-                product_content = generate_product_overview(
-                    main_content,
-                    self.config.project_name,
-                    self.tech_stack,
-                    self.results
-                )
-
-                product_filename = f"{self.config.project_name}-Product-Overview.md"
-                product_path = self.config.output_dir / product_filename
-
-                with open(product_path, 'w', encoding='utf-8') as f:
-                    f.write(product_content)
-
-                documents.append(product_filename)
-                if not self.config.quiet:
-                    print(f"Generated: {product_path}")
-                    lines = product_content.count('\n')
-                    print(f"  Product Overview: {lines} lines")
+                main_content = self.generate_main_document()
+                main_write = writer.submit(write_document, main_path, main_content)
             except Exception as e:
-                errors.append(f"Failed to generate product overview: {e}")
-        elif self.config.skip_product_overview and not self.config.quiet:
-            print("Skipping Phase 10 (Product Overview)")
+                errors.append(f"Failed to generate main document: {e}")
+
+            # Generate Product Overview (Phase 10) - NEW
+            product_content = ""
+            product_write = None
+            if not self.config.skip_product_overview and main_content:
+                try:
+                    if not self.config.quiet:
+                        print("\nPhase 10: Generating Product Overview...")
+
+                    product_content = generate_product_overview(
+                        main_content,
+                        self.config.project_name,
+                        self.tech_stack,
+                        self.results,
+                        self.now
+                    )
+                    product_write = writer.submit(write_document, product_path, product_content)
+                except Exception as e:
+                    errors.append(f"Failed to generate product overview: {e}")
+            elif self.config.skip_product_overview and not self.config.quiet:
+                print("Skipping Phase 10 (Product Overview)")
+
+            # The main document is handed off; don't hold it through validation
+            main_content = None
+
+            # The index links only documents that were actually written
+            if main_write is not None:
+                try:
+                    main_write.result()
+                    documents.append(main_filename)
+                    if not self.config.quiet:
+                        print(f"Generated: {main_path}")
+                except Exception as e:
+                    errors.append(f"Failed to generate main document: {e}")
+
+            if product_write is not None:
+                try:
+                    product_write.result()
+                    documents.append(product_filename)
+                    if not self.config.quiet:
+                        print(f"Generated: {product_path}")
+                        # Only counted for this progress line, so --quiet skips the scan
+                        lines = product_content.count('\n')
+                        print(f"  Product Overview: {lines} lines")
+                except Exception as e:
+                    errors.append(f"Failed to generate product overview: {e}")
 
         # Generate index
         try:
             index_content = self.generate_index(documents)
             index_path = self.config.output_dir / "INDEX.md"
 
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(index_content)
+            write_document(index_path, index_content)
 
             if not self.config.quiet:
                 print(f"Generated: {index_path}")
@@ -1126,7 +1400,7 @@ This document provides a complete technical mapping of **{self.config.project_na
         # Run validations
         if documents and not self.config.skip_validation:
             main_path = self.config.output_dir / documents[0]
-            validation = run_validations(str(main_path), str(self.config.project_path))
+            validation = self.validate(main_path)
         else:
             validation = ValidationReport()
 
@@ -1142,8 +1416,8 @@ This document provides a complete technical mapping of **{self.config.project_na
         )
 
 
-def output_json(result: AssemblyResult) -> str:
-    """Format assembly result as JSON."""
+def output_json(result: AssemblyResult, pretty: bool = True) -> str:
+    """Format assembly result as JSON, compact when pretty is False."""
     output = {
         "success": result.success,
         "output_path": result.output_path,
@@ -1159,6 +1433,8 @@ def output_json(result: AssemblyResult) -> str:
         },
         "errors": result.errors
     }
+    if not pretty:
+        return json.dumps(output, separators=(",", ":"))
     return json.dumps(output, indent=2)
 
 
@@ -1232,6 +1508,12 @@ Examples:
         help="Output format for status (default: markdown)"
     )
 
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Emit JSON status without indentation (for piping into other tools)"
+    )
+
     args = parser.parse_args()
 
     # Validate project path
@@ -1259,7 +1541,7 @@ Examples:
 
     # Output result
     if args.format == "json":
-        print(output_json(result))
+        print(output_json(result, pretty=not args.compact))
     else:
         if result.errors:
             print("ERRORS:", file=sys.stderr)
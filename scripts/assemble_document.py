@@ -16,6 +16,7 @@ Options:
     --chunk-size N    Number of files per chunk (default: 100)
     --progress        Show progress during analysis
     --quiet           Suppress progress output
+    --cache           With --skip-validation, reuse output for unchanged inputs
     --format FORMAT   Output format (markdown only for now)
     --help            Show usage information
 
@@ -27,15 +28,28 @@ Exit Codes:
 
 import argparse
 import datetime
+import hashlib
+import io
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Document validators run in-process when the sibling modules are importable
+try:
+    import validate_mermaid
+    import verify_paths
+    IN_PROCESS_VALIDATION = True
+except ImportError:
+    IN_PROCESS_VALIDATION = False
+
 
 @dataclass
 class ValidationReport:
@@ -65,133 +79,193 @@ class AssemblyResult:
     errors: list[str] = field(default_factory=list)
 
 
+# Sections of the assembled document, in order
+DOCUMENT_SECTIONS = (
+    "Overview", "System Context", "Containers", "Components",
+    "Data Schema", "Features", "Onboarding", "Technical Debt",
+)
+
 # Script locations (relative to this script)
 SCRIPT_DIR = Path(__file__).parent
 
+# Resolved once so a missing git costs no failed process spawn per lookup
+GIT_EXECUTABLE = shutil.which('git')
 
+
+@lru_cache(maxsize=32)
 def get_codebase_version(codebase_path: Path) -> str:
     """Get git commit info if available."""
+    if GIT_EXECUTABLE is None:
+        return "Unknown (not a git repository)"
+
     try:
-        commit = subprocess.check_output(
-            ['git', 'rev-parse', '--short', 'HEAD'],
+        # One git call for both the abbreviated hash and the ref decoration;
+        # the decoration lists "HEAD -> branch" (just "HEAD" when detached),
+        # but items such as "grafted" on shallow clones or "tag: v1" can come
+        # before it
+        output = subprocess.check_output(
+            [GIT_EXECUTABLE, 'show', '-s', '--no-show-signature', '--format=%h%n%D', 'HEAD'],
             cwd=codebase_path,
             stderr=subprocess.DEVNULL
         ).decode().strip()
 
-        branch = subprocess.check_output(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            cwd=codebase_path,
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
+        commit, _, decoration = output.partition('\n')
+        branch = "HEAD"
+        for ref in decoration.split(", "):
+            if ref.startswith("HEAD -> "):
+                branch = ref[len("HEAD -> "):]
+                break
 
         return f"{commit} ({branch})"
     except (subprocess.CalledProcessError, FileNotFoundError):
         return "Unknown (not a git repository)"
 
 
+# Directories searched for manifests, in priority order
+TECH_STACK_SEARCH_DIRS = ('', 'backend', 'frontend', 'server', 'api', 'src')
+PYTHON_SEARCH_DIRS = ('', 'backend', 'server', 'api', 'src')
+
+
+# package.json dependency names that identify a technology: (label, packages).
+# Matched against exact dependency names, so "nextauth" is not Next.js.
+NPM_FRAMEWORKS = (
+    ("React", frozenset({"react", "react-dom"})),
+    ("Next.js", frozenset({"next"})),
+    ("Express", frozenset({"express"})),
+    ("Fastify", frozenset({"fastify"})),
+    ("TypeScript", frozenset({"typescript"})),
+)
+NPM_DATABASES = (
+    ("PostgreSQL", frozenset({"pg", "postgres"})),
+    ("MySQL", frozenset({"mysql", "mysql2"})),
+    ("MongoDB", frozenset({"mongoose", "mongodb"})),
+    ("Redis", frozenset({"redis", "ioredis"})),
+    ("Prisma", frozenset({"prisma", "@prisma/client"})),
+)
+
+
+# Package name at the start of a requirements.txt line. Comments, blank
+# lines and pip options (-r, --index-url) don't start with a name.
+_REQUIREMENT_NAME_RE = re.compile(r'^[ \t]*([A-Za-z0-9][A-Za-z0-9._-]*)', re.MULTILINE)
+
+# Substrings of requirement names that identify a technology: (label, markers)
+PYTHON_FRAMEWORKS = (
+    ("FastAPI", frozenset({"fastapi"})),
+    ("Flask", frozenset({"flask"})),
+    ("Django", frozenset({"django"})),
+    ("SQLAlchemy", frozenset({"sqlalchemy"})),
+)
+PYTHON_DATABASES = (
+    ("PostgreSQL", frozenset({"psycopg", "postgres"})),
+    ("Redis", frozenset({"redis"})),
+)
+_PYTHON_MARKER_RE = re.compile('|'.join(
+    re.escape(marker)
+    for _, markers in PYTHON_FRAMEWORKS + PYTHON_DATABASES
+    for marker in sorted(markers)
+))
+
+
+def _scan_dir(path) -> dict:
+    """Entries of a directory by name, from a single scandir() call."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+@lru_cache(maxsize=32)
 def detect_tech_stack(codebase_path: Path) -> str:
     """Detect technology stack summary."""
-    tech = []
-
-    # Check for package.json (Node.js)
-    for subdir in ['', 'backend', 'frontend', 'server', 'api', 'src']:
-        check_path = codebase_path / subdir / "package.json" if subdir else codebase_path / "package.json"
-        if check_path.exists():
-            tech.append("Node.js")
+    # Insertion-ordered dict used as an ordered set
+    tech = {}
+
+    # List each candidate directory once instead of probing every
+    # manifest path with its own stat(). The root listing tells which
+    # subdirectories exist, so absent ones are never opened.
+    root = _scan_dir(codebase_path)
+    present = {'': root.keys()}
+    for subdir in TECH_STACK_SEARCH_DIRS[1:]:
+        entry = root.get(subdir)
+        present[subdir] = _scan_dir(entry.path).keys() if entry is not None and entry.is_dir() else ()
+
+    # Manifests are read at most once and shared by the framework and
+    # database checks; None marks a file that couldn't be read or parsed.
+    # Only package names and markers are kept, not the file contents.
+    requirement_markers = {}
+    package_deps = {}
+
+    def read_requirement_markers(subdir: str) -> Optional[frozenset]:
+        """Technology markers found in a requirements.txt's package names."""
+        if subdir not in requirement_markers:
+            path = codebase_path / subdir / "requirements.txt" if subdir else codebase_path / "requirements.txt"
+            try:
+                text = path.read_text(encoding='utf-8', errors='ignore')
+                names = "\n".join(_REQUIREMENT_NAME_RE.findall(text)).lower()
+                # One scan for every marker instead of one substring search each
+                requirement_markers[subdir] = frozenset(_PYTHON_MARKER_RE.findall(names))
+            except OSError:  # unreadable file
+                requirement_markers[subdir] = None
+        return requirement_markers[subdir]
+
+    def read_package_deps(subdir: str) -> Optional[frozenset]:
+        """Lowercased dependency and devDependency names of a package.json."""
+        if subdir not in package_deps:
+            path = codebase_path / subdir / "package.json" if subdir else codebase_path / "package.json"
             try:
-                with open(check_path) as f:
-                    data = json.load(f)
+                data = json.loads(path.read_bytes())
                 deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+                package_deps[subdir] = frozenset(name.lower() for name in deps)
+            except (OSError, ValueError, AttributeError, TypeError):  # unreadable or malformed manifest
+                package_deps[subdir] = None
+        return package_deps[subdir]
 
-                if "react" in str(deps).lower():
-                    tech.append("React")
-                if "next" in str(deps).lower():
-                    tech.append("Next.js")
-                if "express" in str(deps).lower():
-                    tech.append("Express")
-                if "fastify" in str(deps).lower():
-                    tech.append("Fastify")
-                if "typescript" in str(deps).lower():
-                    tech.append("TypeScript")
-            except:
-                pass
+    # Check for package.json (Node.js)
+    for subdir in TECH_STACK_SEARCH_DIRS:
+        if "package.json" in present[subdir]:
+            tech["Node.js"] = None
+            deps = read_package_deps(subdir)
+            for label, packages in NPM_FRAMEWORKS if deps else ():
+                if not deps.isdisjoint(packages):
+                    tech[label] = None
             break
 
     # Check for requirements.txt (Python)
-    for subdir in ['', 'backend', 'server', 'api', 'src']:
-        check_path = codebase_path / subdir / "requirements.txt" if subdir else codebase_path / "requirements.txt"
-        if check_path.exists():
-            tech.append("Python")
-            try:
-                with open(check_path) as f:
-                    content = f.read().lower()
-                if "fastapi" in content:
-                    tech.append("FastAPI")
-                if "flask" in content:
-                    tech.append("Flask")
-                if "django" in content:
-                    tech.append("Django")
-                if "sqlalchemy" in content:
-                    tech.append("SQLAlchemy")
-            except:
-                pass
+    for subdir in PYTHON_SEARCH_DIRS:
+        if "requirements.txt" in present[subdir]:
+            tech["Python"] = None
+            markers = read_requirement_markers(subdir)
+            for label, needles in PYTHON_FRAMEWORKS if markers else ():
+                if not markers.isdisjoint(needles):
+                    tech[label] = None
             break
 
     # Check for go.mod (Go)
-    if (codebase_path / "go.mod").exists():
-        tech.append("Go")
+    if "go.mod" in present['']:
+        tech["Go"] = None
 
     # Check for pyproject.toml
-    for subdir in ['', 'backend', 'server', 'api', 'src']:
-        check_path = codebase_path / subdir / "pyproject.toml" if subdir else codebase_path / "pyproject.toml"
-        if check_path.exists():
-            if "Python" not in tech:
-                tech.append("Python")
+    for subdir in PYTHON_SEARCH_DIRS:
+        if "pyproject.toml" in present[subdir]:
+            tech["Python"] = None
             break
 
     # Check for databases
-    for subdir in ['', 'backend', 'server', 'api', 'src']:
-        base = codebase_path / subdir if subdir else codebase_path
+    for subdir in PYTHON_SEARCH_DIRS:
+        if "package.json" in present[subdir]:
+            deps = read_package_deps(subdir)
+            for label, packages in NPM_DATABASES if deps else ():
+                if not deps.isdisjoint(packages):
+                    tech[label] = None
 
-        if (base / "package.json").exists():
-            try:
-                with open(base / "package.json") as f:
-                    content = f.read().lower()
-                if "pg" in content or "postgres" in content:
-                    tech.append("PostgreSQL")
-                if "mysql" in content:
-                    tech.append("MySQL")
-                if "mongoose" in content or "mongodb" in content:
-                    tech.append("MongoDB")
-                if "redis" in content or "ioredis" in content:
-                    tech.append("Redis")
-                if "prisma" in content:
-                    tech.append("Prisma")
-            except:
-                pass
-
-        if (base / "requirements.txt").exists():
-            try:
-                with open(base / "requirements.txt") as f:
-                    content = f.read().lower()
-                if "psycopg" in content or "postgres" in content:
-                    if "PostgreSQL" not in tech:
-                        tech.append("PostgreSQL")
-                if "redis" in content:
-                    if "Redis" not in tech:
-                        tech.append("Redis")
-            except:
-                pass
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_tech = []
-    for t in tech:
-        if t not in seen:
-            seen.add(t)
-            unique_tech.append(t)
-
-    return " · ".join(unique_tech) if unique_tech else "Unknown"
+        if "requirements.txt" in present[subdir]:
+            markers = read_requirement_markers(subdir)
+            for label, needles in PYTHON_DATABASES if markers else ():
+                if not markers.isdisjoint(needles):
+                    tech[label] = None
+
+    return " · ".join(tech) if tech else "Unknown"
 
 
 def run_script(script_name: str, args: list[str]) -> tuple[int, str, str]:
@@ -202,19 +276,56 @@ def run_script(script_name: str, args: list[str]) -> tuple[int, str, str]:
         return -1, "", f"Script not found: {script_path}"
 
     try:
+        # Capture raw bytes and decode once at the end rather than running
+        # the pipes through an incremental text decoder
         result = subprocess.run(
             [sys.executable, str(script_path)] + args,
             capture_output=True,
-            text=True,
             timeout=120
         )
-        return result.returncode, result.stdout, result.stderr
+        return (
+            result.returncode,
+            result.stdout.decode('utf-8', errors='replace'),
+            result.stderr.decode('utf-8', errors='replace'),
+        )
     except subprocess.TimeoutExpired:
         return -1, "", "Script timed out"
     except Exception as e:
         return -1, "", str(e)
 
 
+def _script_summary(script_name: str, args: list[str], keys: tuple) -> Optional[dict]:
+    """Selected "summary" counts from a validator script's JSON output."""
+    code, stdout, stderr = run_script(script_name, args)
+    if code < 0 or not stdout:
+        return None
+    try:
+        summary = json.loads(stdout).get("summary", {})
+    except json.JSONDecodeError:
+        return {"error": "Failed to parse output"}
+    return {key: summary.get(key, 0) for key in keys}
+
+
+def _verify_paths_summary(document_path: str, codebase_path: str) -> Optional[dict]:
+    """Path verification counts, computed in this process."""
+    try:
+        result = verify_paths.verify_paths(
+            document_path, codebase_path, verify_paths.DEFAULT_IGNORE_PATTERNS
+        )
+    except (SystemExit, Exception):  # the validator exits on unreadable inputs
+        return None
+    return {"total": result.total, "found": result.found, "missing": result.missing}
+
+
+def _mermaid_summary(document_path: str) -> Optional[dict]:
+    """Mermaid validation counts, computed in this process."""
+    try:
+        result = validate_mermaid.validate_document(document_path)
+    except (SystemExit, Exception):  # the validator exits on unreadable inputs
+        return None
+    return {"total": result.total, "valid": result.valid, "invalid": result.invalid}
+
+
 def run_validations(document_path: str, codebase_path: str, skip: bool = False) -> ValidationReport:
     """Run all validation scripts."""
     report = ValidationReport()
@@ -222,40 +333,38 @@ def run_validations(document_path: str, codebase_path: str, skip: bool = False)
     if skip:
         return report
 
+    # The validators are independent; start them together so the total wait
+    # is the slowest one rather than the sum. Path and diagram checks only
+    # read the generated document, so they run in this process and skip an
+    # interpreter startup each. Schema analysis walks the whole codebase and
+    # keeps its own process so it doesn't compete for the GIL.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        schema_job = executor.submit(run_script, "schema_analysis.py", [
+            codebase_path, "--completeness", "--format", "json"
+        ])
+        if IN_PROCESS_VALIDATION:
+            paths_job = executor.submit(_verify_paths_summary, document_path, codebase_path)
+            mermaid_job = executor.submit(_mermaid_summary, document_path)
+        else:
+            paths_job = executor.submit(_script_summary, "verify_paths.py", [
+                document_path, codebase_path, "--format", "json"
+            ], ("total", "found", "missing"))
+            mermaid_job = executor.submit(_script_summary, "validate_mermaid.py", [
+                document_path, "--format", "json"
+            ], ("total", "valid", "invalid"))
+
     # Path verification
-    code, stdout, stderr = run_script("verify_paths.py", [
-        document_path, codebase_path, "--format", "json"
-    ])
-    if code >= 0 and stdout:
-        try:
-            data = json.loads(stdout)
-            report.path_verification = {
-                "total": data.get("summary", {}).get("total", 0),
-                "found": data.get("summary", {}).get("found", 0),
-                "missing": data.get("summary", {}).get("missing", 0),
-            }
-        except json.JSONDecodeError:
-            report.path_verification = {"error": "Failed to parse output"}
+    summary = paths_job.result()
+    if summary is not None:
+        report.path_verification = summary
 
     # Mermaid validation
-    code, stdout, stderr = run_script("validate_mermaid.py", [
-        document_path, "--format", "json"
-    ])
-    if code >= 0 and stdout:
-        try:
-            data = json.loads(stdout)
-            report.mermaid_validation = {
-                "total": data.get("summary", {}).get("total", 0),
-                "valid": data.get("summary", {}).get("valid", 0),
-                "invalid": data.get("summary", {}).get("invalid", 0),
-            }
-        except json.JSONDecodeError:
-            report.mermaid_validation = {"error": "Failed to parse output"}
+    summary = mermaid_job.result()
+    if summary is not None:
+        report.mermaid_validation = summary
 
     # Schema completeness (use empty documented tables - we're just detecting)
-    code, stdout, stderr = run_script("schema_analysis.py", [
-        codebase_path, "--completeness", "--format", "json"
-    ])
+    code, stdout, stderr = schema_job.result()
     if code >= 0 and stdout:
         try:
             data = json.loads(stdout)
@@ -271,88 +380,92 @@ def run_validations(document_path: str, codebase_path: str, skip: bool = False)
     return report
 
 
+# Numbered section headers ("## 3. Container Architecture") and the characters
+# dropped when turning a title into an anchor
+_SECTION_HEADER_RE = re.compile(r'^##\s+(\d+)\.\s+(.+)$', re.MULTILINE)
+_ANCHOR_STRIP_RE = re.compile(r'[^a-z0-9-]+')
+
+
 def generate_toc(content: str) -> str:
     """Generate table of contents from markdown headers."""
-    lines = []
-    lines.append("## Table of Contents\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("## Table of Contents\n\n")
 
     # Find all ## headers (section headers)
-    header_pattern = r'^##\s+(\d+)\.\s+(.+)$'
-    matches = re.findall(header_pattern, content, re.MULTILINE)
-
-    for num, title in matches:
+    for num, title in _SECTION_HEADER_RE.findall(content):
         # Create anchor
         anchor = f"#{num.lower()}-{title.lower().replace(' ', '-').replace('&', 'and')}"
-        anchor = re.sub(r'[^a-z0-9-]', '', anchor)
-        lines.append(f"{num}. [{title}]({anchor})")
+        anchor = _ANCHOR_STRIP_RE.sub('', anchor)
+        w(f"{num}. [{title}]({anchor})\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_validation_report_md(report: ValidationReport) -> str:
     """Generate validation report markdown section."""
-    lines = []
-    lines.append("---\n")
-    lines.append("## Validation Report\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("---\n\n")
+    w("## Validation Report\n\n")
 
     timestamp = datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
-    lines.append(f"**Generated:** {timestamp}\n")
+    w(f"**Generated:** {timestamp}\n\n")
 
     # Path Verification
-    lines.append("### Path Verification\n")
+    w("### Path Verification\n\n")
     pv = report.path_verification
     if pv.get("error"):
-        lines.append(f"**Error:** {pv['error']}\n")
+        w(f"**Error:** {pv['error']}\n\n")
     else:
-        lines.append("| Status | Count |")
-        lines.append("|--------|-------|")
-        lines.append(f"| Found | {pv.get('found', 0)} |")
-        lines.append(f"| Missing | {pv.get('missing', 0)} |")
-        lines.append("")
+        w("| Status | Count |\n")
+        w("|--------|-------|\n")
+        w(f"| Found | {pv.get('found', 0)} |\n")
+        w(f"| Missing | {pv.get('missing', 0)} |\n")
+        w("\n")
 
         if pv.get('missing', 0) > 0:
-            lines.append("**Warning:** Some file paths could not be verified.\n")
+            w("**Warning:** Some file paths could not be verified.\n\n")
 
     # Mermaid Validation
-    lines.append("### Mermaid Validation\n")
+    w("### Mermaid Validation\n\n")
     mv = report.mermaid_validation
     if mv.get("error"):
-        lines.append(f"**Error:** {mv['error']}\n")
+        w(f"**Error:** {mv['error']}\n\n")
     else:
-        lines.append("| Status | Count |")
-        lines.append("|--------|-------|")
-        lines.append(f"| Valid | {mv.get('valid', 0)} |")
-        lines.append(f"| Invalid | {mv.get('invalid', 0)} |")
-        lines.append("")
+        w("| Status | Count |\n")
+        w("|--------|-------|\n")
+        w(f"| Valid | {mv.get('valid', 0)} |\n")
+        w(f"| Invalid | {mv.get('invalid', 0)} |\n")
+        w("\n")
 
         if mv.get('invalid', 0) > 0:
-            lines.append("**Warning:** Some diagrams have syntax errors.\n")
+            w("**Warning:** Some diagrams have syntax errors.\n\n")
 
     # Schema Completeness
-    lines.append("### Schema Completeness\n")
+    w("### Schema Completeness\n\n")
     sc = report.schema_completeness
     if sc.get("error"):
-        lines.append(f"**Error:** {sc['error']}\n")
+        w(f"**Error:** {sc['error']}\n\n")
     else:
-        lines.append("| Metric | Value |")
-        lines.append("|--------|-------|")
-        lines.append(f"| Coverage | {sc.get('coverage_percentage', 0)}% |")
-        lines.append(f"| Models Detected | {sc.get('detected_count', 0)} |")
-        lines.append("")
+        w("| Metric | Value |\n")
+        w("|--------|-------|\n")
+        w(f"| Coverage | {sc.get('coverage_percentage', 0)}% |\n")
+        w(f"| Models Detected | {sc.get('detected_count', 0)} |\n")
+        w("\n")
 
         if not sc.get('is_complete', True):
-            lines.append("**Warning:** Some schema documentation may be incomplete.\n")
+            w("**Warning:** Some schema documentation may be incomplete.\n\n")
 
     # Overall Status
-    lines.append("### Overall Status\n")
+    w("### Overall Status\n\n")
     if report.has_errors:
-        lines.append("**Result:** Document generated with validation warnings.\n")
-        lines.append("**Recommendation:** Review and fix validation errors before using this document.\n")
+        w("**Result:** Document generated with validation warnings.\n\n")
+        w("**Recommendation:** Review and fix validation errors before using this document.\n")
     else:
-        lines.append("**Result:** All validations passed.\n")
+        w("**Result:** All validations passed.\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def assemble_document(
@@ -363,9 +476,15 @@ def assemble_document(
     chunked: bool = False,
     chunk_size: int = 100,
     show_progress: bool = False,
-    quiet: bool = False
+    quiet: bool = False,
+    use_cache: bool = False
 ) -> AssemblyResult:
-    """Assemble the final architecture document."""
+    """Assemble the final architecture document.
+
+    With use_cache and skip_validation, the output is named after a hash of
+    everything the document is built from, and an existing file with that
+    name is returned as-is instead of being regenerated.
+    """
     codebase = Path(codebase_path)
 
     if not codebase.exists():
@@ -382,20 +501,42 @@ def assemble_document(
     if not project_name:
         project_name = codebase.name
 
-    # Get metadata
-    codebase_version = get_codebase_version(codebase)
-    tech_stack = detect_tech_stack(codebase)
+    # Get metadata (memoized per resolved path for callers that assemble
+    # several documents from one codebase)
+    resolved = codebase.resolve()
+    codebase_version = get_codebase_version(resolved)
+    tech_stack = detect_tech_stack(resolved)
     generated_at = datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
 
-    # Generate output filename
-    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-    output_filename = f"System-Architecture-Reference-{project_name}-{timestamp}.md"
+    # Generate output filename. Without validation the document depends only
+    # on the values below, so a cached run can name it by their hash.
+    cacheable = use_cache and skip_validation
+    if cacheable:
+        key = hashlib.blake2b(
+            f"{project_name}|{codebase_path}|{codebase_version}|{tech_stack}".encode(),
+            digest_size=8
+        ).hexdigest()
+        output_filename = f"System-Architecture-Reference-{project_name}-{key}.md"
+    else:
+        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_filename = f"System-Architecture-Reference-{project_name}-{timestamp}.md"
 
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     output_file = output_path / output_filename
 
+    if cacheable and output_file.is_file():
+        mtime = datetime.datetime.fromtimestamp(output_file.stat().st_mtime)
+        return AssemblyResult(
+            output_path=str(output_file),
+            project_name=project_name,
+            codebase_version=codebase_version,
+            generated_at=mtime.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            validation=ValidationReport(),
+            sections=list(DOCUMENT_SECTIONS)
+        )
+
     # Build document content
     # This is a template-based approach - in a real implementation,
     # you would call the individual analysis scripts to generate each section
@@ -561,11 +702,16 @@ python scripts/technical_debt_analyzer.py {codebase_path} --format markdown
 *Document generated by Architecture Audit Agent*
 """
 
-    # Write document
+    # Write document. The file stays open while the validators read it back
+    # from disk, so the validation report is appended without reopening it.
+    out = None
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        out = open(output_file, 'w', encoding='utf-8')
+        out.write(content)
+        out.flush()
     except Exception as e:
+        if out is not None:
+            out.close()
         return AssemblyResult(
             output_path="",
             project_name=project_name,
@@ -575,17 +721,18 @@ python scripts/technical_debt_analyzer.py {codebase_path} --format markdown
             errors=[f"Failed to write document: {e}"]
         )
 
-    # Run validations
-    validation = run_validations(str(output_file), str(codebase), skip_validation)
+    with out:
+        # Run validations
+        validation = run_validations(str(output_file), str(codebase), skip_validation)
 
-    # Append validation report
-    if not skip_validation:
-        validation_md = generate_validation_report_md(validation)
-        try:
-            with open(output_file, 'a', encoding='utf-8') as f:
-                f.write("\n" + validation_md)
-        except Exception as e:
-            pass  # Non-fatal
+        # Append validation report
+        if not skip_validation:
+            validation_md = generate_validation_report_md(validation)
+            try:
+                out.write("\n" + validation_md)
+                out.flush()
+            except Exception as e:
+                pass  # Non-fatal
 
     return AssemblyResult(
         output_path=str(output_file),
@@ -593,7 +740,7 @@ python scripts/technical_debt_analyzer.py {codebase_path} --format markdown
         codebase_version=codebase_version,
         generated_at=generated_at,
         validation=validation,
-        sections=["Overview", "System Context", "Containers", "Components", "Data Schema", "Features", "Onboarding", "Technical Debt"]
+        sections=list(DOCUMENT_SECTIONS)
     )
 
 
@@ -682,6 +829,12 @@ Examples:
         help="Suppress progress output"
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="With --skip-validation, reuse the document from a previous run on unchanged inputs"
+    )
+
     parser.add_argument(
         "--format",
         choices=["markdown", "json"],
@@ -700,7 +853,8 @@ Examples:
         chunked=args.chunked,
         chunk_size=args.chunk_size,
         show_progress=args.progress,
-        quiet=args.quiet
+        quiet=args.quiet,
+        use_cache=args.cache
     )
 
     # Output result
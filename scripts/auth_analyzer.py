@@ -10,6 +10,9 @@ Usage:
 
 Options:
     --format json|markdown    Output format (default: json)
+    --compact                 Emit JSON without indentation
+    --exhaustive              Scan every file for auth type detection
+    --jobs N                  Worker processes for large projects (default: CPU count)
     --help                    Show usage information
 
 Detection capabilities:
@@ -23,13 +26,22 @@ Detection capabilities:
 """
 
 import argparse
+import io
 import json
+import mmap
+import multiprocessing
+import os
 import re
 import sys
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
 
 class AuthType(Enum):
@@ -67,8 +79,8 @@ class AuthMiddleware:
 class RoleModel:
     """Role-based access control model."""
     roles: list[str] = field(default_factory=list)
-    permission_check_location: str = ""
     rbac_type: str = "role-based"  # role-based, claim-based, permission-based
+    permission_check_location: str = ""
     admin_check: str = ""
 
 
@@ -97,154 +109,609 @@ class AuthAnalysisResult:
     errors: list[str] = field(default_factory=list)
 
 
+@dataclass
+class SourceFindings:
+    """Everything the analyzers extract from a single source file."""
+    relative_path: str
+    suffix: str
+    detections: list[tuple[str, str]] = field(default_factory=list)  # (category, label)
+    mentions_cookie: bool = False  # a detection label or the file path mentions a cookie
+    generation_line: int = 0
+    validation_line: int = 0
+    token_configs: list[TokenConfig] = field(default_factory=list)
+    algorithm: str = ""
+    middleware: list[AuthMiddleware] = field(default_factory=list)
+    role_check: bool = False
+    permission_check: bool = False
+    roles: list[str] = field(default_factory=list)
+    routes: list[tuple[ProtectedEndpoint, str]] = field(default_factory=list)  # (endpoint, handler source)
+
+
+# Source files read by the analyzers
+SOURCE_EXTENSIONS = ('.py', '.ts', '.js', '.tsx', '.jsx')
+MIDDLEWARE_EXTENSIONS = ('.py', '.ts', '.js')
+
+# Middleware is only looked for in files whose path mentions one of these
+MIDDLEWARE_PATH_TOKENS = ('auth', 'middleware')
+
+# Directories skipped by every analyzer, plus the extra ones individual analyzers skip
+SKIP_DIRS = frozenset({'__pycache__', 'venv', '.venv'})
+DETECTION_SKIP_DIRS = frozenset({'node_modules', '.git', 'dist', 'build'})
+MIDDLEWARE_SKIP_DIRS = frozenset({'node_modules', 'dist'})
+TEST_DIRS = frozenset({'tests'})
+
+# Lowercase keywords of which every analyzer pattern needs at least one; files
+# containing none of them are skipped before decoding. Checked against the
+# pattern tables below when the module is imported.
+AUTH_MARKERS = (
+    b'jwt', b'token', b'session', b'auth', b'login', b'passport', b'social_core',
+    b'bearer', b'get_current_', b'guard', b'role', b'permission', b'admin',
+    b'superuser', b'staff', b'@router', b'@app',
+)
+
+# Dataclass fields left out of the JSON report: the flow description and admin
+# check are Markdown-only, and per-middleware routes are not collected
+JSON_OMITTED_FIELDS = frozenset({'auth_flow_description', 'admin_check', 'protected_routes'})
+
+# Auth type detection stops early once at least this many JWT detections
+# outnumber session and OAuth detections two to one (see --exhaustive)
+EARLY_STOP_MIN_JWT = 5
+
+# Files larger than this are memory mapped rather than read; markers are
+# searched in chunks of this size
+MMAP_MIN_SIZE = 1 << 20
+MARKER_CHUNK_SIZE = 1 << 20
+
+# Trees with at least this many source files are scanned by a process pool,
+# in batches to amortize pickling the paths and findings
+PARALLEL_SCAN_MIN_FILES = 256
+SCAN_BATCH_SIZE = 64
+
+
 # JWT detection patterns
 JWT_PATTERNS = {
     'python': [
-        (r"from jose import jwt", "python-jose"),
-        (r"from jose\.jwt import", "python-jose"),
-        (r"import jwt", "PyJWT"),
-        (r"jwt\.encode\(", "JWT creation"),
-        (r"jwt\.decode\(", "JWT validation"),
-        (r"create_access_token", "Access token creation"),
-        (r"verify_token", "Token verification"),
+        (re.compile(r"from jose import jwt"), "python-jose"),
+        (re.compile(r"from jose\.jwt import"), "python-jose"),
+        (re.compile(r"import jwt"), "PyJWT"),
+        (re.compile(r"jwt\.encode\("), "JWT creation"),
+        (re.compile(r"jwt\.decode\("), "JWT validation"),
+        (re.compile(r"create_access_token"), "Access token creation"),
+        (re.compile(r"verify_token"), "Token verification"),
     ],
     'nodejs': [
-        (r"require\(['\"]jsonwebtoken['\"]\)", "jsonwebtoken"),
-        (r"from ['\"]jsonwebtoken['\"]", "jsonwebtoken"),
-        (r"jwt\.sign\(", "JWT creation"),
-        (r"jwt\.verify\(", "JWT validation"),
+        (re.compile(r"require\(['\"]jsonwebtoken['\"]\)"), "jsonwebtoken"),
+        (re.compile(r"from ['\"]jsonwebtoken['\"]"), "jsonwebtoken"),
+        (re.compile(r"jwt\.sign\("), "JWT creation"),
+        (re.compile(r"jwt\.verify\("), "JWT validation"),
     ],
 }
 
 # Session detection patterns
 SESSION_PATTERNS = {
     'python': [
-        (r"from flask_login import", "Flask-Login"),
-        (r"from django\.contrib\.auth import", "Django Auth"),
-        (r"session\[['\"]", "Session access"),
-        (r"flask_session", "Flask-Session"),
+        (re.compile(r"from flask_login import"), "Flask-Login"),
+        (re.compile(r"from django\.contrib\.auth import"), "Django Auth"),
+        (re.compile(r"session\[['\"]"), "Session access"),
+        (re.compile(r"flask_session"), "Flask-Session"),
     ],
     'nodejs': [
-        (r"express-session", "Express Session"),
-        (r"cookie-session", "Cookie Session"),
-        (r"req\.session", "Session access"),
-        (r"sessionMiddleware", "Session middleware"),
+        (re.compile(r"express-session"), "Express Session"),
+        (re.compile(r"cookie-session"), "Cookie Session"),
+        (re.compile(r"req\.session"), "Session access"),
+        (re.compile(r"sessionMiddleware"), "Session middleware"),
     ],
 }
 
 # OAuth detection patterns
 OAUTH_PATTERNS = {
     'python': [
-        (r"from authlib\.integrations", "Authlib"),
-        (r"authlib\.oauth", "Authlib OAuth"),
-        (r"from social_core", "Python Social Auth"),
+        (re.compile(r"from authlib\.integrations"), "Authlib"),
+        (re.compile(r"authlib\.oauth"), "Authlib OAuth"),
+        (re.compile(r"from social_core"), "Python Social Auth"),
     ],
     'nodejs': [
-        (r"passport", "Passport.js"),
-        (r"passport-google", "Google OAuth"),
-        (r"passport-github", "GitHub OAuth"),
-        (r"passport-facebook", "Facebook OAuth"),
-        (r"@auth0/", "Auth0"),
-        (r"next-auth", "NextAuth.js"),
+        (re.compile(r"passport"), "Passport.js"),
+        (re.compile(r"passport-google"), "Google OAuth"),
+        (re.compile(r"passport-github"), "GitHub OAuth"),
+        (re.compile(r"passport-facebook"), "Facebook OAuth"),
+        (re.compile(r"@auth0/"), "Auth0"),
+        (re.compile(r"next-auth"), "NextAuth.js"),
     ],
 }
 
 # API Key detection patterns
 API_KEY_PATTERNS = [
-    (r"x-api-key", "X-API-Key header"),
-    (r"api_key", "api_key parameter"),
-    (r"apikey", "apikey parameter"),
-    (r"X-Api-Key", "X-Api-Key header"),
+    (re.compile(r"x-api-key"), "X-API-Key header"),
+    (re.compile(r"api_key"), "api_key parameter"),
+    (re.compile(r"apikey"), "apikey parameter"),
+    (re.compile(r"X-Api-Key"), "X-Api-Key header"),
 ]
 
 # Auth middleware patterns
 AUTH_MIDDLEWARE_PATTERNS = {
     'python': [
         # FastAPI dependencies
-        (r"(get_current_\w+)\s*[=:]?\s*(?:async\s+)?def", "FastAPI dependency"),
-        (r"Depends\((get_current_\w+)\)", "FastAPI Depends"),
-        (r"HTTPBearer\(\)", "HTTP Bearer scheme"),
-        (r"OAuth2PasswordBearer", "OAuth2 password flow"),
+        (re.compile(r"(get_current_\w+)\s*[=:]?\s*(?:async\s+)?def"), "FastAPI dependency"),
+        (re.compile(r"Depends\((get_current_\w+)\)"), "FastAPI Depends"),
+        (re.compile(r"HTTPBearer\(\)"), "HTTP Bearer scheme"),
+        (re.compile(r"OAuth2PasswordBearer"), "OAuth2 password flow"),
         # Flask
-        (r"@login_required", "Flask login required"),
-        (r"@auth_required", "Auth required decorator"),
+        (re.compile(r"@login_required"), "Flask login required"),
+        (re.compile(r"@auth_required"), "Auth required decorator"),
         # Django
-        (r"@permission_required", "Django permission"),
-        (r"@login_required", "Django login required"),
+        (re.compile(r"@permission_required"), "Django permission"),
+        (re.compile(r"@login_required"), "Django login required"),
     ],
     'nodejs': [
         # Express middleware
-        (r"(authMiddleware|authenticate|auth\.middleware)", "Auth middleware"),
-        (r"requireAuth", "Require auth"),
-        (r"checkAuth", "Check auth"),
+        (re.compile(r"(authMiddleware|authenticate|auth\.middleware)"), "Auth middleware"),
+        (re.compile(r"requireAuth"), "Require auth"),
+        (re.compile(r"checkAuth"), "Check auth"),
         # NestJS guards
-        (r"@UseGuards\((\w+Guard)\)", "NestJS Guard"),
-        (r"JwtAuthGuard", "JWT Auth Guard"),
-        (r"AuthGuard\(['\"](\w+)['\"]\)", "Auth Guard"),
+        (re.compile(r"@UseGuards\((\w+Guard)\)"), "NestJS Guard"),
+        (re.compile(r"JwtAuthGuard"), "JWT Auth Guard"),
+        (re.compile(r"AuthGuard\(['\"](\w+)['\"]\)"), "Auth Guard"),
     ],
 }
 
 # Cookie patterns for cookie-based auth
 COOKIE_PATTERNS = [
-    (r"response\.set_cookie\(", "Set cookie"),
-    (r"set_cookie\(", "Set cookie"),
-    (r"request\.cookies\.get\(", "Get cookie"),
-    (r"httponly\s*=\s*True", "HTTP-only cookie"),
-    (r"HttpOnly", "HTTP-only cookie"),
-    (r"secure\s*=\s*True", "Secure cookie"),
+    (re.compile(r"response\.set_cookie\("), "Set cookie"),
+    (re.compile(r"set_cookie\("), "Set cookie"),
+    (re.compile(r"request\.cookies\.get\("), "Get cookie"),
+    (re.compile(r"httponly\s*=\s*True"), "HTTP-only cookie"),
+    (re.compile(r"HttpOnly"), "HTTP-only cookie"),
+    (re.compile(r"secure\s*=\s*True"), "Secure cookie"),
 ]
 
-# RBAC patterns
+# RBAC patterns, matched case-insensitively against lowercased content so the
+# literal prefixes still let the regex engine skip ahead
 RBAC_PATTERNS = {
     'role_check': [
-        r"is_admin|is_superuser|is_staff",
-        r"role\s*==\s*['\"]admin['\"]",
-        r"role\s*in\s*\[",
-        r"has_role\(['\"](\w+)['\"]\)",
-        r"require_role\(['\"](\w+)['\"]\)",
-        r"@require_roles",
-        r"@has_role",
+        re.compile(r"is_admin|is_superuser|is_staff"),
+        re.compile(r"role\s*==\s*['\"]admin['\"]"),
+        re.compile(r"role\s*in\s*\["),
+        re.compile(r"has_role\(['\"](\w+)['\"]\)"),
+        re.compile(r"require_role\(['\"](\w+)['\"]\)"),
+        re.compile(r"@require_roles"),
+        re.compile(r"@has_role"),
     ],
     'permission_check': [
-        r"has_permission\(['\"](\w+)['\"]\)",
-        r"check_permission",
-        r"require_permission\(['\"](\w+)['\"]\)",
-        r"@require_permission",
-        r"@has_permission",
+        re.compile(r"has_permission\(['\"](\w+)['\"]\)"),
+        re.compile(r"check_permission"),
+        re.compile(r"require_permission\(['\"](\w+)['\"]\)"),
+        re.compile(r"@require_permission"),
+        re.compile(r"@has_permission"),
     ],
 }
 
+# Patterns used while extracting token, role and route details
+_TOKEN_GENERATION_RE = re.compile(r'(create_access_token|jwt\.encode|generate.*token)', re.I)
+_TOKEN_VALIDATION_RE = re.compile(r'(verify_token|jwt\.decode|decode.*token)', re.I)
+_ACCESS_EXPIRE_RE = re.compile(r'ACCESS_TOKEN_EXPIRE_(?:MINUTES|HOURS)\s*[=:]\s*(\d+)')
+_REFRESH_EXPIRE_RE = re.compile(r'REFRESH_TOKEN_EXPIRE_(?:DAYS|HOURS)\s*[=:]\s*(\d+)')
+_COOKIE_STORAGE_RE = re.compile(r'(set_cookie|response\.cookies)')
+_ROTATION_RE = re.compile(r'(family|rotate|rotation)', re.I)
+_JWT_ALGORITHM_RE = re.compile(r'JWT_ALGORITHM\s*[=:]\s*["\']?(\w+)["\']?')
+_ROLE_EQUALS_RE = re.compile(r"role\s*==\s*['\"](\w+)['\"]")
+_ROLE_IN_RE = re.compile(r"role\s*in\s*\[([^\]]+)\]")
+_QUOTED_WORD_RE = re.compile(r"['\"](\w+)['\"]")
+_ADMIN_FLAG_RE = re.compile(r'\.is_admin|\.is_superuser|\.is_staff')
+_ROUTE_RE = re.compile(r'(?:@router|@app)\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']', re.I)
+_FUNC_DEF_RE = re.compile(r'(?:async\s+)?def\s+(\w+)\s*\([^)]*\)')
+_ADMIN_REQUIRED_RE = re.compile(r'(get_current_admin|is_admin|admin_only)', re.I)
+_NEWLINE_RE = re.compile(r'\n')
+
+
+# Detection patterns flattened per language as (category, label, pattern). Each
+# pattern is searched on its own: their literal prefixes let the regex engine
+# skip ahead, which a capturing alternation of all of them would disable.
+_DETECTION_PATTERNS = {
+    language: [
+        (category, label, pattern)
+        for category, table in (('JWT', JWT_PATTERNS), ('Session', SESSION_PATTERNS), ('OAuth', OAUTH_PATTERNS))
+        for pattern, label in table[language]
+    ]
+    for language in ('python', 'nodejs')
+}
 
-def detect_auth_type(project_path: Path) -> tuple[AuthType, list[str]]:
-    """Detect the primary authentication type used in the project."""
-    detections = []
 
-    for ext in ['.py', '.ts', '.js', '.tsx', '.jsx']:
-        for file_path in project_path.rglob(f"*{ext}"):
-            if any(part in file_path.parts for part in ['node_modules', '.git', '__pycache__', 'venv', '.venv', 'dist', 'build']):
-                continue
+def _patterns_without_markers() -> list[str]:
+    """Sources of prefiltered patterns that contain none of the AUTH_MARKERS."""
+    markers = [marker.decode() for marker in AUTH_MARKERS]
+    patterns = chain(
+        (pattern for table in _DETECTION_PATTERNS.values() for _, _, pattern in table),
+        (pattern for table in AUTH_MIDDLEWARE_PATTERNS.values() for pattern, _ in table),
+        chain.from_iterable(RBAC_PATTERNS.values()),
+        (_ROUTE_RE, _TOKEN_GENERATION_RE, _TOKEN_VALIDATION_RE, _ACCESS_EXPIRE_RE, _REFRESH_EXPIRE_RE,
+         _JWT_ALGORITHM_RE, _ROLE_EQUALS_RE, _ROLE_IN_RE, _ADMIN_FLAG_RE),
+    )
+    return [pattern.pattern for pattern in patterns if not any(marker in pattern.pattern.lower() for marker in markers)]
 
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
 
-                # Check JWT patterns
-                for pattern, label in JWT_PATTERNS.get('python' if ext == '.py' else 'nodejs', []):
-                    if re.search(pattern, content):
-                        detections.append(f"JWT: {label} in {file_path.relative_to(project_path)}")
+# The marker prefilter would silently drop files matched by a pattern without one
+assert not _patterns_without_markers(), f"patterns missing from AUTH_MARKERS: {_patterns_without_markers()}"
 
-                # Check session patterns
-                for pattern, label in SESSION_PATTERNS.get('python' if ext == '.py' else 'nodejs', []):
-                    if re.search(pattern, content):
-                        detections.append(f"Session: {label} in {file_path.relative_to(project_path)}")
 
-                # Check OAuth patterns
-                for pattern, label in OAUTH_PATTERNS.get('python' if ext == '.py' else 'nodejs', []):
-                    if re.search(pattern, content):
-                        detections.append(f"OAuth: {label} in {file_path.relative_to(project_path)}")
+# Detection patterns whose label mentions a cookie; still searched once auth
+# type detection has stopped early, since they decide JWT cookie vs bearer
+_COOKIE_DETECTION_PATTERNS = {
+    language: [(category, label, pattern) for category, label, pattern in patterns if 'cookie' in label.lower()]
+    for language, patterns in _DETECTION_PATTERNS.items()
+}
 
-            except Exception:
-                continue
+
+def _scan_detections(language: str, content: str) -> list[tuple[str, str]]:
+    """Return the (category, label) of every detection pattern found in content."""
+    return [(category, label) for category, label, pattern in _DETECTION_PATTERNS[language] if pattern.search(content)]
+
+
+def _mentions_cookie(relative_path: str, detections: list[tuple[str, str]]) -> bool:
+    """Whether any detection, as listed by detect_auth_type, mentions a cookie."""
+    if not detections:
+        return False
+    return 'cookie' in relative_path.lower() or any('cookie' in label.lower() for _, label in detections)
+
+
+def _iter_source_files(project_path: Path) -> Iterator[Path]:
+    """Yield every source file the analyzers look at, in directory walk order.
+
+    Walks with os.scandir, pruning skipped directories before descending into
+    them; each directory's files come before its subdirectories, as with rglob.
+    Python files are always yielded. Other files are only yielded when auth
+    type detection or the middleware search would read them, so bundles under
+    node_modules or dist are never opened.
+    """
+    parts = project_path.parts
+    pending = [(str(project_path), DETECTION_SKIP_DIRS.isdisjoint(parts), MIDDLEWARE_SKIP_DIRS.isdisjoint(parts))]
+    while pending:
+        directory, detect, middleware = pending.pop()
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in SKIP_DIRS:
+                            subdirs.append((
+                                entry.path,
+                                detect and name not in DETECTION_SKIP_DIRS,
+                                middleware and name not in MIDDLEWARE_SKIP_DIRS,
+                            ))
+                    elif name.endswith('.py'):
+                        files.append(entry.path)
+                    elif name.endswith(SOURCE_EXTENSIONS):
+                        if detect or (middleware and name.endswith(MIDDLEWARE_EXTENSIONS) and _is_middleware_path(entry.path)):
+                            files.append(entry.path)
+        except OSError:
+            continue
+
+        for file_path in files:
+            yield Path(file_path)
+        pending.extend(reversed(subdirs))
+
+
+def _is_middleware_path(file_path: str) -> bool:
+    """Whether a file's path marks it as a place to look for auth middleware."""
+    # No token spans a path separator, so testing the lowered path once is
+    # the same as testing each component
+    path_lower = file_path.lower()
+    return any(token in path_lower for token in MIDDLEWARE_PATH_TOKENS)
+
+
+def _match_at_literal(pattern: re.Pattern, content: str, literal: str, start: int) -> Optional[re.Match]:
+    """First match of a pattern that begins with literal, trying it only where literal occurs.
+
+    start is the first occurrence of literal; anchoring with pattern.match at
+    each occurrence gives the same result as pattern.search(content) without
+    scanning the rest of the file.
+    """
+    while start != -1:
+        match = pattern.match(content, start)
+        if match:
+            return match
+        start = content.find(literal, start + 1)
+    return None
+
+
+def _newline_offsets(content: str) -> list[int]:
+    """Offsets of every newline in content, for bisecting match positions to line numbers."""
+    return [match.start() for match in _NEWLINE_RE.finditer(content)]
+
+
+def _scan_jwt_config(findings: SourceFindings, content: str) -> None:
+    """Record token generation/validation sites and token settings of a file."""
+    # Find token creation and validation; neither pattern spans lines, so the
+    # first match in the file is on the first matching line
+    match = _TOKEN_GENERATION_RE.search(content)
+    if match:
+        findings.generation_line = content.count('\n', 0, match.start()) + 1
+    match = _TOKEN_VALIDATION_RE.search(content)
+    if match:
+        findings.validation_line = content.count('\n', 0, match.start()) + 1
+
+    # Check for access token config
+    index = content.find('ACCESS_TOKEN_EXPIRE')
+    if index != -1:
+        access_expiry = ""
+        match = _match_at_literal(_ACCESS_EXPIRE_RE, content, 'ACCESS_TOKEN_EXPIRE', index)
+        if match:
+            access_expiry = f"{match.group(1)} minutes" if 'MINUTES' in match.group(0) else f"{match.group(1)} hours"
+
+        # Check storage type
+        storage = "header"
+        if _COOKIE_STORAGE_RE.search(content):
+            storage = "cookie"
+
+        findings.token_configs.append(TokenConfig(
+            token_type="access",
+            storage=storage,
+            expiry=access_expiry,
+        ))
+
+    # Check for refresh token config
+    index = content.find('REFRESH_TOKEN_EXPIRE')
+    if index != -1:
+        refresh_expiry = ""
+        match = _match_at_literal(_REFRESH_EXPIRE_RE, content, 'REFRESH_TOKEN_EXPIRE', index)
+        if match:
+            refresh_expiry = f"{match.group(1)} days" if 'DAYS' in match.group(0) else f"{match.group(1)} hours"
+
+        # Check for rotation
+        rotation = bool(_ROTATION_RE.search(content))
+
+        findings.token_configs.append(TokenConfig(
+            token_type="refresh",
+            storage="cookie",
+            expiry=refresh_expiry,
+            rotation=rotation,
+        ))
+
+    # Extract algorithm
+    index = content.find('JWT_ALGORITHM')
+    if index != -1:
+        algo_match = _match_at_literal(_JWT_ALGORITHM_RE, content, 'JWT_ALGORITHM', index)
+        if algo_match:
+            findings.algorithm = algo_match.group(1)
+
+
+def _scan_middleware(findings: SourceFindings, content: str) -> None:
+    """Record every auth middleware/dependency match in a file."""
+    patterns = AUTH_MIDDLEWARE_PATTERNS['python' if findings.suffix == '.py' else 'nodejs']
+    newlines = None
+    for pattern, label in patterns:
+        for match in pattern.finditer(content):
+            if newlines is None:
+                newlines = _newline_offsets(content)
+            line_num = bisect_left(newlines, match.start()) + 1
+            name = match.group(1) if match.groups() else label
+
+            findings.middleware.append(AuthMiddleware(
+                name=name,
+                file_path=findings.relative_path,
+                line_number=line_num,
+                description=label,
+            ))
+
+
+def _scan_rbac(findings: SourceFindings, content: str) -> None:
+    """Record role/permission checks and role names used in a file."""
+    lowered = content.lower()
+    findings.role_check = any(pattern.search(lowered) for pattern in RBAC_PATTERNS['role_check'])
+    findings.permission_check = any(pattern.search(lowered) for pattern in RBAC_PATTERNS['permission_check'])
+
+    # Extract role values
+    findings.roles.extend(_ROLE_EQUALS_RE.findall(content))
+
+    for role_list in _ROLE_IN_RE.findall(content):
+        findings.roles.extend(_QUOTED_WORD_RE.findall(role_list))
+
+    # Check for is_admin checks
+    if _ADMIN_FLAG_RE.search(content):
+        findings.roles.append('admin')
+
+
+def _scan_routes(findings: SourceFindings, content: str) -> None:
+    """Record FastAPI routes along with the source window that follows them."""
+    for match in _ROUTE_RE.finditer(content):
+        # Look for the handler definition right after the decorator
+        func_start = match.end()
+        func_end = func_start + 500
+        func_match = _FUNC_DEF_RE.search(content, func_start, func_end)
+        if not func_match:
+            continue
+
+        # Check for admin requirement
+        role_required = "admin" if _ADMIN_REQUIRED_RE.search(content, match.start(), func_end) else ""
+
+        # Auth dependencies are resolved once all middleware is known
+        func_content = content[match.start():func_end]
+
+        findings.routes.append((ProtectedEndpoint(
+            method=match.group(1).upper(),
+            path=match.group(2),
+            auth_required="No",
+            role_required=role_required,
+            handler=func_match.group(1),
+        ), func_content))
+
+
+def scan_source_file(file_path: Path, relative_path: str, content: str, detect: bool = True) -> SourceFindings:
+    """Run every per-file analysis over one source file.
+
+    detect=False skips the auth type detection patterns, once the project's
+    auth type is already settled. Cookie evidence is still collected then,
+    searching only the cookie patterns unless the path itself mentions one.
+    """
+    suffix = file_path.suffix
+    parts = file_path.parts
+    findings = SourceFindings(relative_path=relative_path, suffix=suffix)
+
+    if DETECTION_SKIP_DIRS.isdisjoint(parts):
+        language = 'python' if suffix == '.py' else 'nodejs'
+        if detect:
+            findings.detections = _scan_detections(language, content)
+            findings.mentions_cookie = _mentions_cookie(relative_path, findings.detections)
+        elif 'cookie' in relative_path.lower():
+            findings.mentions_cookie = bool(_scan_detections(language, content))
+        else:
+            findings.mentions_cookie = any(pattern.search(content) for _, _, pattern in _COOKIE_DETECTION_PATTERNS[language])
+
+    # Focus on auth-related files
+    if suffix in MIDDLEWARE_EXTENSIONS and MIDDLEWARE_SKIP_DIRS.isdisjoint(parts) and _is_middleware_path(str(file_path)):
+        _scan_middleware(findings, content)
+
+    if suffix == '.py':
+        if TEST_DIRS.isdisjoint(parts):
+            _scan_jwt_config(findings, content)
+            _scan_routes(findings, content)
+        _scan_rbac(findings, content)
+
+    return findings
+
+
+def _has_auth_markers(data) -> bool:
+    """Check raw bytes (a memoryview or memory map) for any AUTH_MARKERS keyword.
+
+    The data is lowercased a chunk at a time, with chunks overlapping by the
+    longest marker, so a mapped file never needs a full in-memory copy.
+    """
+    overlap = max(len(marker) for marker in AUTH_MARKERS) - 1
+    for start in range(0, max(len(data), 1), MARKER_CHUNK_SIZE):
+        lowered = bytes(data[start:start + MARKER_CHUNK_SIZE + overlap]).lower()
+        if any(marker in lowered for marker in AUTH_MARKERS):
+            return True
+    return False
+
+
+def _read_source(file_path: Path, buffer: bytearray) -> Optional[str]:
+    """Read a source file, or return None if it is unreadable or has no auth markers.
+
+    Files up to MMAP_MIN_SIZE are read into buffer, which the caller owns and
+    reuses across files. Larger ones (generated clients, vendored bundles) are
+    memory mapped, so rejecting them never copies their contents into Python
+    memory.
+    """
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= MMAP_MIN_SIZE:
+                # Read into the reused buffer instead of allocating bytes per file
+                view = memoryview(buffer)
+                length = 0
+                while length < size:
+                    count = f.readinto(view[length:])
+                    if not count:
+                        break
+                    length += count
+                data = view[:length]
+
+                # Reject files without any marker on the raw bytes, before paying for decoding
+                if not _has_auth_markers(data):
+                    return None
+                content = str(data, 'utf-8', 'ignore')
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if not _has_auth_markers(mapped):
+                        return None
+                    content = str(mapped, 'utf-8', 'ignore')
+    except (OSError, ValueError):
+        return None
+
+    if '\r' in content:
+        # Match the newline translation of text-mode reads
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _jwt_is_conclusive(counts: Counter) -> bool:
+    """Whether running detection counts already settle on JWT auth."""
+    jwt_count = counts['JWT']
+    return jwt_count >= EARLY_STOP_MIN_JWT and jwt_count > 2 * (counts['Session'] + counts['OAuth'])
+
+
+def _scan_batch(project_path: Path, batch: list[Path], exhaustive: bool) -> list[SourceFindings]:
+    """Read and scan a batch of files; runs inside worker processes.
+
+    Unless exhaustive, detection patterns stop running once the files seen
+    so far are conclusive; detect_auth_type stops counting at the same file.
+    """
+    results = []
+    counts = Counter()
+    detect = True
+    # One read buffer per scan, so concurrent scans never share one
+    buffer = bytearray(MMAP_MIN_SIZE)
+    for file_path in batch:
+        content = _read_source(file_path, buffer)
+        if content is None:
+            continue
+
+        findings = scan_source_file(file_path, str(file_path.relative_to(project_path)), content, detect)
+        if detect and not exhaustive:
+            counts.update(category for category, _ in findings.detections)
+            detect = not _jwt_is_conclusive(counts)
+        results.append(findings)
+    return results
+
+
+def _pool_context() -> Optional[multiprocessing.context.BaseContext]:
+    """Start method for scan workers: fork where it is safe, else the platform default.
+
+    Every pattern table is compiled when this module is imported, so forked
+    workers inherit the compiled patterns from the parent. Under spawn (Windows,
+    macOS) each worker re-imports the module and compiles them once at startup;
+    shipping the compiled objects instead would not help, since re.Pattern
+    pickles as its source and is recompiled on load.
+    """
+    if sys.platform != 'darwin' and 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def scan_project(project_path: Path, jobs: Optional[int] = None, exhaustive: bool = False) -> list[SourceFindings]:
+    """Scan every source file once, in walk order.
+
+    Large trees are split into batches and scanned by a process pool; the
+    batches come back in submission order so results match a serial scan.
+    Batches only see part of the tree, so they always run detection
+    exhaustively and leave the early stop to detect_auth_type.
+    """
+    paths = list(_iter_source_files(project_path))
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs > 1 and len(paths) >= PARALLEL_SCAN_MIN_FILES:
+        batches = [paths[i:i + SCAN_BATCH_SIZE] for i in range(0, len(paths), SCAN_BATCH_SIZE)]
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context()) as executor:
+                return [
+                    findings
+                    for batch_results in executor.map(_scan_batch, repeat(project_path), batches, repeat(True))
+                    for findings in batch_results
+                ]
+        except (OSError, BrokenProcessPool):
+            # No usable process pool here (e.g. sandboxed semaphores); scan serially
+            pass
+
+    return _scan_batch(project_path, paths, exhaustive)
+
+
+def detect_auth_type(files: list[SourceFindings], exhaustive: bool = False) -> tuple[AuthType, list[str]]:
+    """Detect the primary authentication type used in the project.
+
+    Unless exhaustive, counting stops at the first file after which JWT
+    detections clearly dominate. Whether JWTs live in cookies is still
+    decided from every file.
+    """
+    detections = []
+    counts = Counter()
+    for findings in files:
+        detections.extend(f"{category}: {label} in {findings.relative_path}" for category, label in findings.detections)
+        if not exhaustive:
+            counts.update(category for category, _ in findings.detections)
+            if _jwt_is_conclusive(counts):
+                break
 
     # Determine primary auth type based on detections
     jwt_count = sum(1 for d in detections if d.startswith("JWT:"))
@@ -253,7 +720,7 @@ def detect_auth_type(project_path: Path) -> tuple[AuthType, list[str]]:
 
     if jwt_count > session_count and jwt_count > oauth_count:
         # Check if cookie-based JWT
-        cookie_found = any('cookie' in d.lower() for d in detections)
+        cookie_found = any(findings.mentions_cookie for findings in files)
         return (AuthType.JWT_COOKIE if cookie_found else AuthType.JWT_BEARER, detections)
     elif session_count > 0:
         return AuthType.SESSION, detections
@@ -263,81 +730,25 @@ def detect_auth_type(project_path: Path) -> tuple[AuthType, list[str]]:
     return AuthType.UNKNOWN, detections
 
 
-def extract_jwt_config(project_path: Path) -> tuple[list[TokenConfig], str, str]:
+def extract_jwt_config(files: list[SourceFindings]) -> tuple[list[TokenConfig], str, str]:
     """Extract JWT configuration details."""
     token_configs = []
     validation_path = ""
     generation_path = ""
 
-    for file_path in project_path.rglob("*.py"):
-        if any(part in file_path.parts for part in ['__pycache__', 'venv', '.venv', 'tests']):
-            continue
+    for findings in files:
+        if findings.generation_line and not generation_path:
+            generation_path = f"{findings.relative_path}:{findings.generation_line}"
+        if findings.validation_line and not validation_path:
+            validation_path = f"{findings.relative_path}:{findings.validation_line}"
 
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                lines = content.split('\n')
-
-            relative_path = str(file_path.relative_to(project_path))
-
-            # Find token creation
-            for i, line in enumerate(lines):
-                if re.search(r'(create_access_token|jwt\.encode|generate.*token)', line, re.I):
-                    if not generation_path:
-                        generation_path = f"{relative_path}:{i + 1}"
-
-                    # Try to extract expiry
-                    expiry_match = re.search(r'expires_delta[=:]\s*(?:timedelta\([^)]*\)|[^,\n]+)', line)
-                    expiry = expiry_match.group(0) if expiry_match else ""
-
-                if re.search(r'(verify_token|jwt\.decode|decode.*token)', line, re.I):
-                    if not validation_path:
-                        validation_path = f"{relative_path}:{i + 1}"
-
-            # Check for access token config
-            if 'ACCESS_TOKEN_EXPIRE' in content:
-                access_expiry = ""
-                match = re.search(r'ACCESS_TOKEN_EXPIRE_(?:MINUTES|HOURS)\s*[=:]\s*(\d+)', content)
-                if match:
-                    access_expiry = f"{match.group(1)} minutes" if 'MINUTES' in match.group(0) else f"{match.group(1)} hours"
-
-                # Check storage type
-                storage = "header"
-                if re.search(r'(set_cookie|response\.cookies)', content):
-                    storage = "cookie"
-
-                token_configs.append(TokenConfig(
-                    token_type="access",
-                    storage=storage,
-                    expiry=access_expiry,
-                ))
-
-            # Check for refresh token config
-            if 'REFRESH_TOKEN_EXPIRE' in content:
-                refresh_expiry = ""
-                match = re.search(r'REFRESH_TOKEN_EXPIRE_(?:DAYS|HOURS)\s*[=:]\s*(\d+)', content)
-                if match:
-                    refresh_expiry = f"{match.group(1)} days" if 'DAYS' in match.group(0) else f"{match.group(1)} hours"
-
-                # Check for rotation
-                rotation = bool(re.search(r'(family|rotate|rotation)', content, re.I))
-
-                token_configs.append(TokenConfig(
-                    token_type="refresh",
-                    storage="cookie",
-                    expiry=refresh_expiry,
-                    rotation=rotation,
-                ))
-
-            # Extract algorithm
+        token_configs.extend(findings.token_configs)
+
+        # A file's algorithm applies to every config still missing one
+        if findings.algorithm:
             for config in token_configs:
                 if not config.algorithm:
-                    algo_match = re.search(r'JWT_ALGORITHM\s*[=:]\s*["\']?(\w+)["\']?', content)
-                    if algo_match:
-                        config.algorithm = algo_match.group(1)
-
-        except Exception:
-            continue
+                    config.algorithm = findings.algorithm
 
     # Deduplicate
     seen = set()
@@ -351,232 +762,172 @@ def extract_jwt_config(project_path: Path) -> tuple[list[TokenConfig], str, str]
     return unique_configs, validation_path, generation_path
 
 
-def find_auth_middleware(project_path: Path) -> list[AuthMiddleware]:
+def find_auth_middleware(files: list[SourceFindings]) -> list[AuthMiddleware]:
     """Find authentication middleware and dependencies."""
     middleware_list = []
+    seen_names = set()
 
-    for ext in ['.py', '.ts', '.js']:
-        for file_path in project_path.rglob(f"*{ext}"):
-            if any(part in file_path.parts for part in ['node_modules', '__pycache__', 'venv', '.venv', 'dist']):
-                continue
-
-            # Focus on auth-related files
-            if 'auth' not in str(file_path).lower() and 'middleware' not in str(file_path).lower():
+    for ext in MIDDLEWARE_EXTENSIONS:
+        for findings in files:
+            if findings.suffix != ext:
                 continue
 
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    lines = content.split('\n')
+            for middleware in findings.middleware:
+                # Check if this middleware is new
+                if middleware.name in seen_names:
+                    continue
 
-                relative_path = str(file_path.relative_to(project_path))
-
-                patterns = AUTH_MIDDLEWARE_PATTERNS.get('python' if ext == '.py' else 'nodejs', [])
-                for pattern, label in patterns:
-                    for match in re.finditer(pattern, content, re.MULTILINE):
-                        line_num = content[:match.start()].count('\n') + 1
-                        name = match.group(1) if match.groups() else label
-
-                        # Check if this middleware is new
-                        existing = next((m for m in middleware_list if m.name == name), None)
-                        if existing:
-                            continue
-
-                        middleware_list.append(AuthMiddleware(
-                            name=name,
-                            file_path=relative_path,
-                            line_number=line_num,
-                            description=label,
-                        ))
-
-            except Exception:
-                continue
+                seen_names.add(middleware.name)
+                middleware_list.append(middleware)
 
     return middleware_list
 
 
-def detect_rbac_model(project_path: Path) -> Optional[RoleModel]:
+def detect_rbac_model(files: list[SourceFindings]) -> Optional[RoleModel]:
     """Detect role-based access control model."""
     roles = set()
-    permission_checks = []
-    admin_checks = []
+    permission_check_location = ""
+    admin_check = ""
     rbac_type = "role-based"
 
-    for file_path in project_path.rglob("*.py"):
-        if any(part in file_path.parts for part in ['__pycache__', 'venv', '.venv']):
-            continue
+    for findings in files:
+        if findings.role_check and not admin_check:
+            admin_check = findings.relative_path
 
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-            # Find role checks
-            for pattern in RBAC_PATTERNS['role_check']:
-                for match in re.finditer(pattern, content, re.I):
-                    admin_checks.append(f"{file_path.relative_to(project_path)}")
-
-            # Find permission checks
-            for pattern in RBAC_PATTERNS['permission_check']:
-                for match in re.finditer(pattern, content, re.I):
-                    permission_checks.append(f"{file_path.relative_to(project_path)}")
-                    rbac_type = "permission-based"
-
-            # Extract role values
-            role_matches = re.findall(r"role\s*==\s*['\"](\w+)['\"]", content)
-            roles.update(role_matches)
-
-            role_in_matches = re.findall(r"role\s*in\s*\[([^\]]+)\]", content)
-            for role_list in role_in_matches:
-                found_roles = re.findall(r"['\"](\w+)['\"]", role_list)
-                roles.update(found_roles)
-
-            # Check for is_admin checks
-            if re.search(r'\.is_admin|\.is_superuser|\.is_staff', content):
-                roles.add('admin')
-
-        except Exception:
-            continue
+        if findings.permission_check:
+            if not permission_check_location:
+                permission_check_location = findings.relative_path
+            rbac_type = "permission-based"
+
+        roles.update(findings.roles)
 
-    if not roles and not permission_checks:
+    if not roles and not permission_check_location:
         return None
 
     return RoleModel(
         roles=list(roles) if roles else ['user', 'admin'],
-        permission_check_location=permission_checks[0] if permission_checks else "",
+        permission_check_location=permission_check_location,
         rbac_type=rbac_type,
-        admin_check=admin_checks[0] if admin_checks else "",
+        admin_check=admin_check,
     )
 
 
-def map_protected_routes(project_path: Path, middleware_list: list[AuthMiddleware]) -> list[ProtectedEndpoint]:
-    """Map protected API endpoints to their authentication requirements."""
-    endpoints = []
+def _middleware_finder(middleware_list: list[AuthMiddleware]) -> Callable[[str], Optional[str]]:
+    """Build a lookup for the first middleware, in list order, named in a text.
 
-    # Find FastAPI routes
-    for file_path in project_path.rglob("*.py"):
-        if any(part in file_path.parts for part in ['__pycache__', 'venv', '.venv', 'tests']):
-            continue
+    All names go into one alternation, longest first, so a single pass over
+    the text replaces a substring test per middleware. The match at each
+    position is the longest name starting there; shorter names it contains
+    are credited through the precomputed containment table.
+    """
+    names = [mw.name for mw in middleware_list]
+    if not names:
+        return lambda text: None
+
+    rank = {name: index for index, name in enumerate(names)}
+    contained = {name: [other for other in names if other in name] for name in names}
+    names_re = re.compile("|".join(re.escape(name) for name in sorted(names, key=len, reverse=True)))
+
+    def find(text: str) -> Optional[str]:
+        best = None
+        match = names_re.search(text)
+        while match:
+            for name in contained[match.group()]:
+                if best is None or rank[name] < rank[best]:
+                    best = name
+            # Resume one character past the match start so overlapping names are seen
+            match = names_re.search(text, match.start() + 1)
+        return best
+
+    return find
 
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                lines = content.split('\n')
-
-            relative_path = str(file_path.relative_to(project_path))
-
-            # FastAPI route patterns
-            route_pattern = r'@(?:router|app)\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']'
-            for match in re.finditer(route_pattern, content, re.I):
-                method = match.group(1).upper()
-                path = match.group(2)
-                line_num = content[:match.start()].count('\n') + 1
-
-                # Check if this route uses auth
-                auth_required = "No"
-                role_required = ""
-
-                # Look for Depends in the same function
-                func_start = match.end()
-                func_match = re.search(r'(?:async\s+)?def\s+(\w+)\s*\([^)]*\)', content[func_start:func_start + 500])
-                if func_match:
-                    handler = func_match.group(1)
-
-                    # Check for auth dependencies in function signature
-                    func_content = content[match.start():func_start + 500]
-                    for mw in middleware_list:
-                        if mw.name in func_content:
-                            auth_required = mw.name
-                            break
-
-                    # Check for admin requirement
-                    if re.search(r'(get_current_admin|is_admin|admin_only)', func_content, re.I):
-                        role_required = "admin"
-
-                    endpoints.append(ProtectedEndpoint(
-                        method=method,
-                        path=path,
-                        auth_required=auth_required,
-                        role_required=role_required,
-                        handler=handler,
-                    ))
-
-        except Exception:
-            continue
 
-    # Deduplicate by method+path
+def map_protected_routes(files: list[SourceFindings], middleware_list: list[AuthMiddleware]) -> list[ProtectedEndpoint]:
+    """Map protected API endpoints to their authentication requirements."""
+    endpoints = []
     seen = set()
-    unique_endpoints = []
-    for ep in endpoints:
-        key = (ep.method, ep.path)
-        if key not in seen:
+    find_middleware = _middleware_finder(middleware_list)
+
+    for findings in files:
+        for endpoint, func_content in findings.routes:
+            # Deduplicate by method+path
+            key = (endpoint.method, endpoint.path)
+            if key in seen:
+                continue
             seen.add(key)
-            unique_endpoints.append(ep)
 
-    return unique_endpoints
+            # Check for auth dependencies in function signature
+            name = find_middleware(func_content)
+            if name:
+                endpoint.auth_required = name
+
+            endpoints.append(endpoint)
+
+    return endpoints
 
 
 def generate_auth_flow_description(result: AuthAnalysisResult) -> str:
-    """Generate a human-readable description of the auth flow."""
-    lines = []
+    """Generate a human-readable description of the auth flow.
+
+    Every line, including the last, ends with a newline; the description is
+    empty when there is nothing to describe.
+    """
+    buf = io.StringIO()
+    w = buf.write
 
     if result.auth_type == AuthType.JWT_BEARER:
-        lines.append("## Authentication Flow (JWT Bearer)")
-        lines.append("")
-        lines.append("1. **Login**: Client sends credentials to `/auth/login`")
-        lines.append("2. **Token Generation**: Server validates credentials and generates JWT")
+        w("## Authentication Flow (JWT Bearer)\n\n")
+        w("1. **Login**: Client sends credentials to `/auth/login`\n")
+        w("2. **Token Generation**: Server validates credentials and generates JWT\n")
         if result.token_generation_path:
-            lines.append(f"   - Location: `{result.token_generation_path}`")
-        lines.append("3. **Client Storage**: Client stores token (typically in memory or localStorage)")
-        lines.append("4. **Authenticated Requests**: Client includes `Authorization: Bearer <token>` header")
+            w(f"   - Location: `{result.token_generation_path}`\n")
+        w("3. **Client Storage**: Client stores token (typically in memory or localStorage)\n")
+        w("4. **Authenticated Requests**: Client includes `Authorization: Bearer <token>` header\n")
         if result.token_validation_path:
-            lines.append(f"5. **Token Validation**: Server validates token at `{result.token_validation_path}`")
+            w(f"5. **Token Validation**: Server validates token at `{result.token_validation_path}`\n")
 
     elif result.auth_type == AuthType.JWT_COOKIE:
-        lines.append("## Authentication Flow (JWT HTTP-only Cookie)")
-        lines.append("")
-        lines.append("1. **Login**: Client sends credentials to `/auth/login`")
-        lines.append("2. **Token Generation**: Server generates access and refresh tokens")
+        w("## Authentication Flow (JWT HTTP-only Cookie)\n\n")
+        w("1. **Login**: Client sends credentials to `/auth/login`\n")
+        w("2. **Token Generation**: Server generates access and refresh tokens\n")
         if result.token_generation_path:
-            lines.append(f"   - Location: `{result.token_generation_path}`")
-        lines.append("3. **Cookie Storage**: Server sets tokens in HTTP-only cookies")
+            w(f"   - Location: `{result.token_generation_path}`\n")
+        w("3. **Cookie Storage**: Server sets tokens in HTTP-only cookies\n")
         for config in result.token_config:
-            lines.append(f"   - {config.token_type.title()} token: expires in {config.expiry or 'N/A'}")
+            w(f"   - {config.token_type.title()} token: expires in {config.expiry or 'N/A'}\n")
             if config.rotation:
-                lines.append("   - Refresh token rotation: Enabled")
-        lines.append("4. **Authenticated Requests**: Browser automatically includes cookies")
+                w("   - Refresh token rotation: Enabled\n")
+        w("4. **Authenticated Requests**: Browser automatically includes cookies\n")
         if result.token_validation_path:
-            lines.append(f"5. **Token Validation**: Server validates token at `{result.token_validation_path}`")
+            w(f"5. **Token Validation**: Server validates token at `{result.token_validation_path}`\n")
 
     elif result.auth_type == AuthType.SESSION:
-        lines.append("## Authentication Flow (Session-based)")
-        lines.append("")
-        lines.append("1. **Login**: Client sends credentials to login endpoint")
-        lines.append("2. **Session Creation**: Server creates session and sets session cookie")
-        lines.append("3. **Authenticated Requests**: Browser includes session cookie")
-        lines.append("4. **Session Validation**: Server validates session ID")
+        w("## Authentication Flow (Session-based)\n\n")
+        w("1. **Login**: Client sends credentials to login endpoint\n")
+        w("2. **Session Creation**: Server creates session and sets session cookie\n")
+        w("3. **Authenticated Requests**: Browser includes session cookie\n")
+        w("4. **Session Validation**: Server validates session ID\n")
 
     elif result.auth_type == AuthType.OAUTH:
-        lines.append("## Authentication Flow (OAuth 2.0)")
-        lines.append("")
-        lines.append("1. **Initiate OAuth**: Client redirects to OAuth provider")
-        lines.append("2. **User Authorization**: User authorizes application")
-        lines.append("3. **Callback**: Provider redirects back with authorization code")
-        lines.append("4. **Token Exchange**: Server exchanges code for access token")
-        lines.append("5. **User Info**: Server retrieves user info from provider")
+        w("## Authentication Flow (OAuth 2.0)\n\n")
+        w("1. **Initiate OAuth**: Client redirects to OAuth provider\n")
+        w("2. **User Authorization**: User authorizes application\n")
+        w("3. **Callback**: Provider redirects back with authorization code\n")
+        w("4. **Token Exchange**: Server exchanges code for access token\n")
+        w("5. **User Info**: Server retrieves user info from provider\n")
 
     # Add RBAC info
     if result.role_model:
-        lines.append("")
-        lines.append(f"## Authorization ({result.role_model.rbac_type})")
-        lines.append("")
-        lines.append(f"**Roles:** {', '.join(result.role_model.roles)}")
+        w("\n")
+        w(f"## Authorization ({result.role_model.rbac_type})\n\n")
+        w(f"**Roles:** {', '.join(result.role_model.roles)}\n")
         if result.role_model.admin_check:
-            lines.append(f"**Admin Check:** `{result.role_model.admin_check}`")
+            w(f"**Admin Check:** `{result.role_model.admin_check}`\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def analyze_project(project_path: str) -> AuthAnalysisResult:
+def analyze_project(project_path: str, jobs: Optional[int] = None, exhaustive: bool = False) -> AuthAnalysisResult:
     """Analyze a project for authentication patterns."""
     path = Path(project_path)
     result = AuthAnalysisResult(project_path=project_path)
@@ -585,21 +936,24 @@ def analyze_project(project_path: str) -> AuthAnalysisResult:
         result.errors.append(f"Project path does not exist: {project_path}")
         return result
 
+    # Read every source file once and share the findings between the analyzers
+    files = scan_project(path, jobs, exhaustive)
+
     # 1. Detect auth type
-    result.auth_type, detections = detect_auth_type(path)
+    result.auth_type, detections = detect_auth_type(files, exhaustive)
 
     # 2. Extract JWT config if applicable
     if result.auth_type in [AuthType.JWT_BEARER, AuthType.JWT_COOKIE]:
-        result.token_config, result.token_validation_path, result.token_generation_path = extract_jwt_config(path)
+        result.token_config, result.token_validation_path, result.token_generation_path = extract_jwt_config(files)
 
     # 3. Find auth middleware
-    result.middleware = find_auth_middleware(path)
+    result.middleware = find_auth_middleware(files)
 
     # 4. Detect RBAC model
-    result.role_model = detect_rbac_model(path)
+    result.role_model = detect_rbac_model(files)
 
     # 5. Map protected routes
-    result.protected_endpoints = map_protected_routes(path, result.middleware)
+    result.protected_endpoints = map_protected_routes(files, result.middleware)
 
     # 6. Generate flow description
     result.auth_flow_description = generate_auth_flow_description(result)
@@ -607,111 +961,84 @@ def analyze_project(project_path: str) -> AuthAnalysisResult:
     return result
 
 
-def output_json(result: AuthAnalysisResult) -> str:
-    """Format result as JSON."""
-    output = {
-        "project_path": result.project_path,
-        "auth_type": result.auth_type.value,
-        "token_config": [
-            {
-                "token_type": tc.token_type,
-                "storage": tc.storage,
-                "expiry": tc.expiry,
-                "algorithm": tc.algorithm,
-                "rotation": tc.rotation,
-            }
-            for tc in result.token_config
-        ],
-        "middleware": [
-            {
-                "name": m.name,
-                "file_path": m.file_path,
-                "line_number": m.line_number,
-                "description": m.description,
-            }
-            for m in result.middleware
-        ],
-        "role_model": {
-            "roles": result.role_model.roles,
-            "rbac_type": result.role_model.rbac_type,
-            "permission_check_location": result.role_model.permission_check_location,
-        } if result.role_model else None,
-        "token_validation_path": result.token_validation_path,
-        "token_generation_path": result.token_generation_path,
-        "protected_endpoints": [
-            {
-                "method": ep.method,
-                "path": ep.path,
-                "auth_required": ep.auth_required,
-                "role_required": ep.role_required,
-                "handler": ep.handler,
-            }
-            for ep in result.protected_endpoints
-        ],
-        "errors": result.errors,
-    }
+def _json_fields(items: list[tuple[str, Any]]) -> dict[str, Any]:
+    """dict_factory for asdict that leaves out fields not part of the JSON report."""
+    return {key: value for key, value in items if key not in JSON_OMITTED_FIELDS}
+
+
+def output_json(result: AuthAnalysisResult, pretty: bool = True) -> str:
+    """Format result as JSON, compact when pretty is False."""
+    output = asdict(result, dict_factory=_json_fields)
+    output["auth_type"] = result.auth_type.value
+    if not pretty:
+        # Without indent, json uses its C encoder
+        return json.dumps(output, separators=(",", ":"))
     return json.dumps(output, indent=2)
 
 
 def output_markdown(result: AuthAnalysisResult) -> str:
     """Format result as Markdown."""
-    lines = ["# Authentication Analysis Report\n"]
-    lines.append(f"**Project:** `{result.project_path}`\n")
-    lines.append(f"**Authentication Type:** {result.auth_type.value}\n")
+    buf = io.StringIO()
+    w = buf.write
+    # Every section opens with the blank line separating it from the one
+    # before, so the report ends right after its last line
+    w("# Authentication Analysis Report\n\n")
+    w(f"**Project:** `{result.project_path}`\n\n")
+    w(f"**Authentication Type:** {result.auth_type.value}\n")
 
     if result.errors:
-        lines.append("## Errors\n")
+        w("\n## Errors\n\n")
         for error in result.errors:
-            lines.append(f"- {error}\n")
-        lines.append("\n")
+            w(f"- {error}\n\n")
+        w("\n")
 
     # Auth flow description
     if result.auth_flow_description:
-        lines.append(result.auth_flow_description)
-        lines.append("")
+        w("\n")
+        w(result.auth_flow_description)
 
     # Token configuration
     if result.token_config:
-        lines.append("### Token Configuration\n")
-        lines.append("| Token Type | Storage | Expiry | Algorithm | Rotation |")
-        lines.append("|------------|---------|--------|-----------|----------|")
+        w("\n### Token Configuration\n\n")
+        w("| Token Type | Storage | Expiry | Algorithm | Rotation |\n")
+        w("|------------|---------|--------|-----------|----------|\n")
         for tc in result.token_config:
             rotation = "Yes" if tc.rotation else "No"
-            lines.append(f"| {tc.token_type} | {tc.storage} | {tc.expiry or '-'} | {tc.algorithm or '-'} | {rotation} |")
-        lines.append("")
+            w(f"| {tc.token_type} | {tc.storage} | {tc.expiry or '-'} | {tc.algorithm or '-'} | {rotation} |\n")
 
     # Auth paths
     if result.token_generation_path or result.token_validation_path:
-        lines.append("### Authentication Paths\n")
-        lines.append("| Aspect | File Path |")
-        lines.append("|--------|-----------|")
+        w("\n### Authentication Paths\n\n")
+        w("| Aspect | File Path |\n")
+        w("|--------|-----------|\n")
         if result.token_generation_path:
-            lines.append(f"| Token Generation | `{result.token_generation_path}` |")
+            w(f"| Token Generation | `{result.token_generation_path}` |\n")
         if result.token_validation_path:
-            lines.append(f"| Token Validation | `{result.token_validation_path}` |")
-        lines.append("")
+            w(f"| Token Validation | `{result.token_validation_path}` |\n")
 
     # Middleware
     if result.middleware:
-        lines.append("### Auth Middleware/Dependencies\n")
-        lines.append("| Name | File | Description |")
-        lines.append("|------|------|-------------|")
-        for m in result.middleware:
-            lines.append(f"| `{m.name}` | `{m.file_path}:{m.line_number}` | {m.description} |")
-        lines.append("")
+        w("\n### Auth Middleware/Dependencies\n\n")
+        w("| Name | File | Description |\n")
+        w("|------|------|-------------|\n")
+        buf.writelines(
+            f"| `{m.name}` | `{m.file_path}:{m.line_number}` | {m.description} |\n"
+            for m in result.middleware
+        )
 
     # Protected endpoints
     if result.protected_endpoints:
-        lines.append("### Protected Endpoints\n")
-        lines.append("| Method | Path | Auth Required | Role |")
-        lines.append("|--------|------|---------------|------|")
-        for ep in result.protected_endpoints[:20]:  # Limit to first 20
-            lines.append(f"| {ep.method} | `{ep.path}` | {ep.auth_required} | {ep.role_required or '-'} |")
+        w("\n### Protected Endpoints\n\n")
+        w("| Method | Path | Auth Required | Role |\n")
+        w("|--------|------|---------------|------|\n")
+        buf.writelines(
+            f"| {ep.method} | `{ep.path}` | {ep.auth_required} | {ep.role_required or '-'} |\n"
+            for ep in result.protected_endpoints[:20]  # Limit to first 20
+        )
         if len(result.protected_endpoints) > 20:
-            lines.append(f"\n*...and {len(result.protected_endpoints) - 20} more endpoints*")
-        lines.append("")
+            w(f"\n*...and {len(result.protected_endpoints) - 20} more endpoints*\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main():
@@ -737,14 +1064,33 @@ Examples:
         help="Output format (default: json)"
     )
 
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Emit JSON without indentation (for piping into other tools)"
+    )
+
+    parser.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="Run auth type detection over every file instead of stopping once JWT usage is conclusive"
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for scanning large projects (default: CPU count)"
+    )
+
     args = parser.parse_args()
 
     # Analyze project
-    result = analyze_project(args.project_path)
+    result = analyze_project(args.project_path, jobs=args.jobs, exhaustive=args.exhaustive)
 
     # Output results
     if args.format == "json":
-        print(output_json(result))
+        print(output_json(result, pretty=not args.compact))
     else:
         print(output_markdown(result))
 